@@ -0,0 +1,106 @@
+"""Helpers shared by the ingestion benchmarks."""
+
+import random
+import time
+import types
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from readmeai.config.settings import CacheSettings, IngestionSettings
+from readmeai.utils.file_handler import FileHandler
+from readmeai.utils.file_resource import get_resource_path
+
+# Packaged settings files read by ingestion, as loaded by ConfigLoader.
+SETTINGS_FILES = (
+    "docs_list",
+    "ignore_list",
+    "languages",
+    "parsers",
+    "tool_config",
+    "tooling",
+)
+
+_PYTHON_SOURCE = '''"""Module {index} of a generated package."""
+
+import os
+
+
+class Handler{index}:
+    """Handle requests for resource {index}."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.items = []
+
+    def add(self, value: int) -> None:
+        # Keep the value   with    uneven     spacing to clean up.
+        self.items.append(value * {index})
+
+    def total(self) -> int:
+        return sum(self.items) + len(os.sep)
+'''
+
+_JAVASCRIPT_SOURCE = """// Component {index} of a generated app.
+export function render{index}(props) {{
+  const items = props.items || [];
+  return items
+    .filter((item) => item.visible)
+    .map((item) => `<li>${{item.label}} {index}</li>`)
+    .join("\\n");
+}}
+"""
+
+_MARKDOWN_SOURCE = """# Page {index}
+
+Some   documentation    text for page {index}, with uneven spacing.
+
+- First point
+- Second point
+"""
+
+
+def load_config(**ingestion: Any) -> types.SimpleNamespace:
+    """Build the settings ingestion reads, without a full config.toml.
+
+    Keyword arguments override the ingestion settings.
+    """
+    file_handler = FileHandler()
+    config = types.SimpleNamespace(
+        config=types.SimpleNamespace(
+            ingestion=IngestionSettings(**ingestion),
+            cache=CacheSettings(),
+        )
+    )
+    for name in SETTINGS_FILES:
+        setattr(
+            config,
+            name,
+            file_handler.read(get_resource_path(file_path=f"{name}.toml")),
+        )
+    return config
+
+
+def generate_tree(root: Path, files: int, seed: int = 0) -> None:
+    """Write a synthetic repository of Python, JavaScript and docs files."""
+    rng = random.Random(seed)
+    templates = (
+        ("py", _PYTHON_SOURCE, 3),
+        ("js", _JAVASCRIPT_SOURCE, 2),
+        ("md", _MARKDOWN_SOURCE, 1),
+    )
+    weights = [weight for _, _, weight in templates]
+    for index in range(files):
+        ext, template, _ = rng.choices(templates, weights)[0]
+        directory = root / f"pkg{index % 50}" / f"mod{index % 7}"
+        directory.mkdir(parents=True, exist_ok=True)
+        # Repeat the body so files have a few kilobytes to clean.
+        content = template.format(index=index) * rng.randint(2, 6)
+        (directory / f"file{index}.{ext}").write_text(content)
+
+
+def timed(function: Callable[[], Any]) -> tuple[float, Any]:
+    """Call a function, returning the elapsed seconds and its result."""
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
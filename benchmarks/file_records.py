@@ -0,0 +1,86 @@
+"""Compare building FileRecords with validating FileContext models.
+
+Reports construction time and memory held per 100k files for validated
+FileContext models, the FileRecords used during ingestion, and those
+records converted to FileContext at the API boundary, which together
+should cost less than validation. Run from the repository root:
+
+    python -m benchmarks.file_records --files 100000
+"""
+
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.common import timed
+from readmeai.ingestion.models import FileContext, FileRecord
+
+# Shared by all files, so only the per-file objects are measured.
+CONTENT = "print('hello')\n"
+LANGUAGES = ("Python", "JavaScript", "Go", "Rust")
+
+
+def _fields(index: int) -> dict[str, Any]:
+    """Fields of a synthetic file."""
+    return {
+        "path": f"src/pkg{index % 100}/module{index}.py",
+        "name": f"module{index}.py",
+        "ext": "py",
+        "language": LANGUAGES[index % len(LANGUAGES)],
+        "content": CONTENT,
+    }
+
+
+def _measure(build: Callable[[], list]) -> tuple[float, int]:
+    """Time a build, then build again to count the bytes its result holds.
+
+    Tracing allocations slows them down, so it is kept out of the timing.
+    """
+    gc.collect()
+    elapsed, built = timed(build)
+    del built
+    gc.collect()
+    tracemalloc.start()
+    built = build()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built
+    return elapsed, held
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=100_000)
+    args = parser.parse_args()
+
+    fields = [_fields(index) for index in range(args.files)]
+    records = [FileRecord(**file) for file in fields]
+    builds = {
+        "FileContext (validated)": lambda: [
+            FileContext(**file) for file in fields
+        ],
+        "FileRecord": lambda: [FileRecord(**file) for file in fields],
+        "FileRecord + to_context": lambda: [
+            FileRecord(**file).to_context() for file in fields
+        ],
+    }
+
+    scale = 100_000 / args.files
+    print(f"Per 100k files, measured over {args.files}:")
+    for name, build in builds.items():
+        elapsed, held = _measure(build)
+        print(
+            f"{name:24} {elapsed * scale:7.3f}s  "
+            f"{held * scale / 2**20:8.1f} MiB"
+        )
+
+    same = [record.to_context() for record in records[:1000]] == [
+        FileContext(**file) for file in fields[:1000]
+    ]
+    print(f"Converted records equal validated models: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Time file ingestion serially, on threads and on processes.
+
+Generates a synthetic repository and processes it with each executor
+mode of FileProcessor. Run from the repository root:
+
+    python -m benchmarks.ingestion_executor --files 20000
+"""
+
+import argparse
+import os
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import generate_tree, load_config, timed
+from readmeai.ingestion.file_processor import FileProcessor
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    modes = {
+        "serial": {"executor": "thread", "max_workers": 1},
+        "thread": {"executor": "thread", "max_workers": args.workers},
+        "process": {"executor": "process", "max_workers": args.workers},
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        repo_path = Path(directory)
+        elapsed, _ = timed(lambda: generate_tree(repo_path, args.files))
+        print(f"Generated {args.files} files in {elapsed:.2f}s")
+
+        # Warm the page cache, so the first mode is not charged for it.
+        FileProcessor(load_config()).walk(repo_path)
+
+        timings = {}
+        results = {}
+        for mode, settings in modes.items():
+            processor = FileProcessor(load_config(**settings))
+            timings[mode], contexts = timed(
+                lambda: processor.process_files(repo_path)
+            )
+            results[mode] = sorted(
+                (context.path, context.content) for context in contexts
+            )
+            print(
+                f"{mode:8} {timings[mode]:7.2f}s  {len(contexts)} files  "
+                f"{timings['serial'] / timings[mode]:.2f}x vs serial"
+            )
+
+        same = all(result == results["serial"] for result in results.values())
+        print(f"Same contexts in every mode: {same}")
+
+
+if __name__ == "__main__":
+    main()
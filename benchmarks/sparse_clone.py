@@ -0,0 +1,114 @@
+"""Compare full and sparse blobless clones of a local bare repository.
+
+Builds a repository whose ignored directories hold large binary assets,
+serves it as a bare `file://` remote allowing object filters, and
+reports clone time and the bytes of objects received by
+`clone_repository` with and without sparse checkout patterns. Both
+clones are ingested to check they yield the same files. Run from the
+repository root:
+
+    python -m benchmarks.sparse_clone --assets-mb 50
+"""
+
+import argparse
+import logging
+import os
+import random
+import tempfile
+from pathlib import Path
+
+import git
+
+from benchmarks.common import generate_tree, load_config, timed
+from readmeai.ingestion.file_processor import FileProcessor
+from readmeai.preprocessor.directory_cleaner import remove_hidden_contents
+from readmeai.readers.git.repository import clone_repository
+from readmeai.readers.git.sparse import sparse_checkout_patterns
+
+# Directories of the ignore list that commonly hold large files.
+IGNORED_DIRECTORIES = ("assets", "data", "media")
+
+
+def _directory_size(path: Path) -> int:
+    """Total size in bytes of the files under a directory."""
+    return sum(
+        os.path.getsize(os.path.join(parent, name))
+        for parent, _, names in os.walk(path)
+        for name in names
+    )
+
+
+def build_fixture(root: Path, files: int, assets_mb: int) -> Path:
+    """Commit a synthetic repository and return its bare clone."""
+    source = root / "source"
+    generate_tree(source, files)
+    rng = random.Random(0)
+    per_file = 1024 * 1024
+    for index in range(assets_mb):
+        directory = source / IGNORED_DIRECTORIES[index % 3]
+        directory.mkdir(exist_ok=True)
+        # Random bytes do not compress, like images and datasets.
+        (directory / f"blob{index}.bin").write_bytes(rng.randbytes(per_file))
+
+    repo = git.Repo.init(source)
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Benchmark")
+        writer.set_value("user", "email", "benchmark@example.com")
+    repo.git.add(A=True)
+    repo.git.commit(m="Generated repository")
+
+    bare = root / "fixture.git"
+    git.Repo.clone_from(str(source), str(bare), bare=True)
+    with git.Repo(bare).config_writer() as writer:
+        writer.set_value("uploadpack", "allowFilter", "true")
+    return bare
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=2_000)
+    parser.add_argument("--assets-mb", type=int, default=50)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    config = load_config()
+    patterns = sparse_checkout_patterns(
+        config.ignore_list.get("ignore_list", {}),
+        config.docs_list.get("docs_list", {}),
+    )
+    processor = FileProcessor(config)
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        url = build_fixture(root, args.files, args.assets_mb).as_uri()
+        print(
+            f"Fixture: {args.files} source files, {args.assets_mb} MiB of "
+            f"assets in {', '.join(IGNORED_DIRECTORIES)}"
+        )
+
+        ingested = {}
+        for mode, sparse_patterns in (("full", None), ("sparse", patterns)):
+            target = root / mode
+            elapsed, _ = timed(
+                lambda: clone_repository(
+                    url, target, sparse_patterns=sparse_patterns
+                )
+            )
+            received = _directory_size(target / ".git" / "objects")
+            remove_hidden_contents(target)
+            checked_out = _directory_size(target)
+            ingested[mode] = sorted(
+                file.path for file in processor.process_files(target)
+            )
+            print(
+                f"{mode:7} {elapsed:6.2f}s  "
+                f"received {received / 2**20:8.2f} MiB  "
+                f"checked out {checked_out / 2**20:8.2f} MiB  "
+                f"{len(ingested[mode])} files ingested"
+            )
+
+        print(f"Same files ingested: {ingested['full'] == ingested['sparse']}")
+
+
+if __name__ == "__main__":
+    main()
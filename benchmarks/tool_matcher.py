@@ -0,0 +1,143 @@
+"""Show that indexed tool detection scales linearly with file count.
+
+Times MetadataExtractor on synthetic file lists of growing size, next to
+the nested loop over files, tools and patterns it replaced, and checks
+that both detect the same tools. Run from the repository root:
+
+    python -m benchmarks.tool_matcher --files 100000
+"""
+
+import argparse
+import fnmatch
+import random
+
+from benchmarks.common import load_config, timed
+from readmeai.ingestion.metadata_extractor import (
+    METADATA_CATEGORIES,
+    MetadataExtractor,
+)
+from readmeai.ingestion.models import FileContext, FileRecord
+
+DIRECTORIES = (
+    "src",
+    "lib",
+    ".github/workflows",
+    "roles/web",
+    "tests",
+    "helm",
+    "deploy",
+)
+NAMES = (
+    "main.py",
+    "README.md",
+    "util.js",
+    "setup.cfg",
+    "config.json",
+    "Makefile",
+    "go.sum",
+)
+
+
+def _match_file_pattern(file_path: str, pattern: str) -> bool:
+    """Match a path against a tool pattern, as before the index."""
+    if pattern.endswith("*"):
+        return file_path.startswith(pattern.rstrip("*"))
+    elif pattern.startswith("*"):
+        return file_path.endswith(pattern[1:])
+    elif "*" in pattern:
+        return fnmatch.fnmatch(file_path, pattern)
+    return file_path.endswith(pattern)
+
+
+def _detect_tools_nested(
+    files: list[FileContext], tool_definitions: dict[str, list[str]]
+) -> dict[str, list[str]]:
+    """Detect tools with a loop over files, tools and patterns."""
+    detected_tools: dict[str, list[str]] = {}
+    for file in files:
+        for tool, patterns in tool_definitions.items():
+            if matching_files := [
+                file.path
+                for pattern in patterns
+                if _match_file_pattern(file.path, pattern)
+            ]:
+                detected_tools.setdefault(tool, []).extend(matching_files)
+    return detected_tools
+
+
+def _file_names(tooling: dict) -> list[str]:
+    """Names matching tool patterns, with wildcards filled in, and others."""
+    names = list(NAMES)
+    for category in METADATA_CATEGORIES:
+        for patterns in tooling.get(category, {}).values():
+            names.extend(
+                pattern.replace("**/", "nested/").replace("*", "demo")
+                for pattern in patterns
+            )
+    return names
+
+
+def _files(
+    count: int, names: list[str], rng: random.Random
+) -> list[FileContext]:
+    """Synthetic file contexts at random depths."""
+    files = []
+    for _ in range(count):
+        parents = rng.sample(DIRECTORIES, rng.randint(0, 2))
+        path = "/".join([*parents, rng.choice(names)])
+        name = path.rsplit("/", 1)[-1]
+        files.append(
+            FileRecord(path, name, name.rpartition(".")[2], "").to_context()
+        )
+    return files
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument(
+        "--nested-limit",
+        type=int,
+        default=25_000,
+        help="largest file count to also time with the nested loop",
+    )
+    args = parser.parse_args()
+
+    config = load_config()
+    extractor = MetadataExtractor(config)
+    names = _file_names(config.tooling)
+    rng = random.Random(0)
+
+    sample = _files(5_000, names, rng)
+    same = all(
+        extractor._detect_tools(sample, extractor.tool_indexes[category])
+        == _detect_tools_nested(sample, config.tooling.get(category, {}))
+        for category in METADATA_CATEGORIES
+    )
+    print(f"Index detects the same tools as the nested loop: {same}")
+
+    print(f"{'files':>8} {'index':>9} {'per file':>10} {'nested':>9}")
+    count = max(args.files // 8, 1)
+    while count <= args.files:
+        files = _files(count, names, rng)
+        elapsed, _ = timed(lambda: extractor.extract_metadata(files))
+        nested = "-"
+        if count <= args.nested_limit:
+            nested_elapsed, _ = timed(
+                lambda: [
+                    _detect_tools_nested(
+                        files, config.tooling.get(category, {})
+                    )
+                    for category in METADATA_CATEGORIES
+                ]
+            )
+            nested = f"{nested_elapsed:.2f}s"
+        print(
+            f"{count:>8} {elapsed:>8.2f}s {elapsed / count * 1e6:>8.2f}us "
+            f"{nested:>9}"
+        )
+        count *= 2
+
+
+if __name__ == "__main__":
+    main()
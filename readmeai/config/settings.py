@@ -12,6 +12,7 @@ from pydantic import (
     Field,
     FilePath,
     NonNegativeFloat,
+    PositiveFloat,
     PositiveInt,
     field_validator,
     model_validator,
@@ -62,6 +63,70 @@ class FileSettings(BaseModel):
     skill_icons: str = Field(description="Skill icon badges.")
 
 
+class CacheSettings(BaseModel):
+    """
+    Persistent cache settings shared across runs.
+    """
+
+    directory: Path | None = Field(
+        default=None,
+        description="Cache directory, caching across runs is off if unset.",
+    )
+    file_contexts_max_bytes: PositiveInt = Field(
+        default=512 * 1024 * 1024,
+        description="Size limit of the processed file context cache.",
+    )
+    mirror_repositories: bool = Field(
+        default=True,
+        description="Keep bare mirrors of cloned repositories in the cache.",
+    )
+    mirrors_max_bytes: PositiveInt = Field(
+        default=10 * 1024 * 1024 * 1024,
+        description="Size limit of the repository mirrors.",
+    )
+    metadata_ttl: NonNegativeFloat = Field(
+        default=3600.0,
+        description="Seconds to use cached repository metadata unchecked.",
+    )
+    metadata_max_bytes: PositiveInt = Field(
+        default=16 * 1024 * 1024,
+        description="Size limit of the repository metadata cache.",
+    )
+    url_probes_ttl: NonNegativeFloat = Field(
+        default=86400.0,
+        description="Seconds to reuse the result of a URL check.",
+    )
+    url_probes_max_bytes: PositiveInt = Field(
+        default=4 * 1024 * 1024,
+        description="Size limit of the URL check cache.",
+    )
+
+
+class HttpSettings(BaseModel):
+    """
+    Settings of the HTTP client shared by all outbound requests.
+    """
+
+    connect_timeout: PositiveFloat = Field(
+        default=5.0, description="Seconds to wait for a connection."
+    )
+    read_timeout: PositiveFloat = Field(
+        default=30.0, description="Seconds to wait for response data."
+    )
+    retries: PositiveInt = Field(
+        default=3, description="Attempts per request, including the first."
+    )
+    max_per_host: PositiveInt = Field(
+        default=8, description="Concurrent requests allowed per host."
+    )
+    llm_read_timeout: PositiveFloat = Field(
+        default=300.0, description="Seconds to wait for an LLM response."
+    )
+    probe_deadline: PositiveFloat = Field(
+        default=10.0, description="Seconds to wait for a batch of URL checks."
+    )
+
+
 class GitSettings(BaseModel):
     """
     User repository settings for a remote or local codebase.
@@ -72,6 +137,26 @@ class GitSettings(BaseModel):
     host_domain: str | None = None
     host: str | None = None
     name: str = ""
+    sparse_clone: bool = Field(
+        default=True,
+        description="Clone without the blobs of paths ingestion ignores.",
+    )
+    copy_local: bool = Field(
+        default=False,
+        description="Copy local repositories instead of reading in place.",
+    )
+    checkout: bool = Field(
+        default=True,
+        description="Check out files instead of reading git objects.",
+    )
+    revision: str = Field(
+        default="HEAD",
+        description="Revision read from git objects without a checkout.",
+    )
+    archive: str | None = Field(
+        default=None,
+        description="URL or path of a tar or zip snapshot to read instead.",
+    )
 
     model_config = ConfigDict(extra="forbid")
 
@@ -100,6 +185,69 @@ class GitSettings(BaseModel):
         return self
 
 
+class IngestionSettings(BaseModel):
+    """
+    Repository ingestion settings.
+    """
+
+    max_workers: PositiveInt | None = Field(
+        default=None,
+        description="Workers for reading, cleaning and parsing files.",
+    )
+    executor: Literal["thread", "process"] = Field(
+        default="thread",
+        description="Run file workers as threads or as processes.",
+    )
+    batch_size: PositiveInt = Field(
+        default=256,
+        description="Files sent to a worker process per task.",
+    )
+    max_file_size: PositiveInt = Field(
+        default=10 * 1024 * 1024,
+        description="Files larger than this many bytes are not read.",
+    )
+    max_read_size: PositiveInt = Field(
+        default=1024 * 1024,
+        description="Text files above this size are sampled, not read whole.",
+    )
+    lazy_content: bool = Field(
+        default=False,
+        description="Read file contents on first access instead of upfront.",
+    )
+    use_mmap: bool = Field(
+        default=False,
+        description="Read lazily loaded file contents through mmap.",
+    )
+    respect_gitignore: bool = Field(
+        default=True,
+        description="Skip paths matched by the repository's .gitignore.",
+    )
+    max_in_flight: PositiveInt = Field(
+        default=1024,
+        description="Files read ahead of the consumer of processed files.",
+    )
+    deduplicate: bool = Field(
+        default=True,
+        description="Process identical files once and list them as aliases.",
+    )
+    manifest_executor: Literal["inline", "process"] = Field(
+        default="inline",
+        description="Parse dependency manifests in file workers or apart.",
+    )
+    streaming: bool = Field(
+        default=False,
+        description="Send the first prompts while files are still ingested.",
+    )
+    workspaces: bool = Field(
+        default=False,
+        description="Write a README for each workspace package of a monorepo.",
+    )
+    workspace_workers: PositiveInt = Field(
+        default=4,
+        description="Workspace package READMEs generated at the same time.",
+    )
+
+
 class MarkdownSettings(BaseModel):
     """
     Markdown code template blocks for building the README.md file.
@@ -182,8 +330,11 @@ class Settings(BaseModel):
     """
 
     api: APISettings
+    cache: CacheSettings = Field(default_factory=CacheSettings)
     files: FileSettings
     git: GitSettings
+    http: HttpSettings = Field(default_factory=HttpSettings)
+    ingestion: IngestionSettings = Field(default_factory=IngestionSettings)
     llm: ModelSettings
     md: MarkdownSettings
 
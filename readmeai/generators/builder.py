@@ -95,7 +95,9 @@ class MarkdownBuilder:
             default_branch=self.metadata.default_branch,
             host_domain=self.git.host_domain,
             full_name=self.git.full_name,
-            examples_path=examples_path.replace(os.sep, "/"),
+            examples_path=examples_path and self.repo_context.repository_path(
+                examples_path.replace(os.sep, "/")
+            ),
         )
 
     @property
@@ -109,10 +111,11 @@ class MarkdownBuilder:
     def license(self) -> str:
         """Generates the README License section"""
         license_path = next(
-            (path for path in self.docs if path.startswith((
-                "LICENSE",
-                "LICENCE"
-            ))),
+            (self.repo_context.repository_path(path)
+             for path in self.docs if path.startswith((
+                 "LICENSE",
+                 "LICENCE"
+             ))),
             self.metadata.license_url
         )
 
@@ -130,9 +133,11 @@ class MarkdownBuilder:
         docs = "docs"
         if not self.metadata.homepage_url:
             if "docs" in self.docs:
+                docs_path = self.repo_context.repository_path("docs")
                 homepage_url = (f"https://{self.git.host_domain}/"
                                 f"{self.git.full_name}/tree/"
-                                f"{self.metadata.default_branch}/docs")
+                                f"{self.metadata.default_branch}/"
+                                f"{docs_path}")
             else:
                 docs = "Not found any docs"
                 homepage_url = ""
@@ -162,7 +167,7 @@ class MarkdownBuilder:
                     host_domain=self.git.host_domain,
                     full_name=self.git.full_name,
                     default_branch=self.metadata.default_branch,
-                    citation_path=path,
+                    citation_path=self.repo_context.repository_path(path),
                 )
 
         return self.md.citation + self.md.citation_v2.format(
@@ -0,0 +1,178 @@
+"""Ingestion source streaming a tar or zip snapshot of a repository."""
+
+import io
+import posixpath
+import re
+import stat
+import tarfile
+import zipfile
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import BinaryIO, NamedTuple
+from urllib.parse import urlparse
+
+import requests
+
+from readmeai.errors import RepositoryProcessingError
+from readmeai.ingestion.sources import FileSource
+from readmeai.logger import get_logger
+from readmeai.utils.http_client import get_http_client
+
+_logger = get_logger(__name__)
+
+# `git archive` stores the commit id as the archive comment.
+_COMMIT_PATTERN = re.compile(r"[0-9a-f]{40}")
+_ZIP_MAGIC = b"PK\x03\x04"
+
+# Decides from a member's path and size whether its content is kept.
+MemberFilter = Callable[[str, int], bool]
+
+
+class ArchiveMember(NamedTuple):
+    """
+    A regular file of the archive, by size in bytes and content if kept.
+    """
+
+    size: int
+    data: bytes | None
+
+
+class ArchiveSource(FileSource):
+    """
+    The files of a tar or zip snapshot, held in memory.
+
+    Tarballs are streamed member by member from a URL or a file, while zip
+    files, whose index is at their end, are buffered first. Only members
+    passing `keep` have their content held, so ignored and oversized
+    members are never written anywhere. A top-level directory shared by
+    all members, as in the snapshots hosts generate, is stripped.
+    """
+
+    def __init__(
+        self, members: dict[str, ArchiveMember], commit: str | None = None
+    ) -> None:
+        self.entries = members
+        self.commit = commit
+
+    @classmethod
+    def load(cls, location: str, keep: MemberFilter) -> "ArchiveSource":
+        """Read an archive from a URL or a path.
+
+        While streaming, it is not known yet whether the first directory of
+        member paths is a shared top-level directory, so members are only
+        kept if `keep` accepts their path both with and without it.
+        """
+        try:
+            with _open_archive(location) as stream:
+                if stream.peek(len(_ZIP_MAGIC)).startswith(_ZIP_MAGIC):
+                    members, comment = _read_zip(stream, keep)
+                else:
+                    members, comment = _read_tar(stream, keep)
+        except (
+            OSError,
+            requests.RequestException,
+            tarfile.TarError,
+            zipfile.BadZipFile,
+        ) as exc:
+            raise RepositoryProcessingError(
+                f"Error reading archive {location}: {exc}"
+            ) from exc
+
+        members = _strip_top_level(members)
+        kept = sum(member.data is not None for member in members.values())
+        _logger.info(
+            f"Read {kept} of {len(members)} files from archive {location}"
+        )
+        commit = comment if _COMMIT_PATTERN.fullmatch(comment) else None
+        return cls(members, commit)
+
+    def read(self, relative_path: str) -> bytes:
+        """Read the content of a file kept from the archive."""
+        member = self.entries.get(relative_path)
+        if member is None or member.data is None:
+            raise FileNotFoundError(
+                f"{relative_path} was not kept from the archive"
+            )
+        return member.data
+
+
+@contextmanager
+def _open_archive(location: str) -> Iterator[BinaryIO]:
+    """Open a URL or a path as a buffered binary stream."""
+    if urlparse(location).scheme not in ("http", "https"):
+        with open(location, "rb") as file:
+            yield file
+        return
+
+    with get_http_client().get(location, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        yield io.BufferedReader(response.raw)
+
+
+def _read_tar(
+    stream: BinaryIO, keep: MemberFilter
+) -> tuple[dict[str, ArchiveMember], str]:
+    """Stream the regular files of a possibly compressed tarball."""
+    members = {}
+    with tarfile.open(fileobj=stream, mode="r|*") as tar:
+        for member in tar:
+            path = _member_path(member.name)
+            if path is None or not member.isfile():
+                continue
+            data = None
+            if _keeps(keep, path, member.size):
+                data = tar.extractfile(member).read()
+            members[path] = ArchiveMember(member.size, data)
+        comment = tar.pax_headers.get("comment", "")
+    return members, comment
+
+
+def _read_zip(
+    stream: BinaryIO, keep: MemberFilter
+) -> tuple[dict[str, ArchiveMember], str]:
+    """Read the regular files of a zip file, buffered in memory."""
+    members = {}
+    with zipfile.ZipFile(io.BytesIO(stream.read())) as archive:
+        for info in archive.infolist():
+            path = _member_path(info.filename)
+            if (
+                path is None
+                or info.is_dir()
+                or stat.S_ISLNK(info.external_attr >> 16)
+            ):
+                continue
+            data = None
+            if _keeps(keep, path, info.file_size):
+                data = archive.read(info)
+            members[path] = ArchiveMember(info.file_size, data)
+        comment = archive.comment.decode("utf-8", "replace")
+    return members, comment
+
+
+def _keeps(keep: MemberFilter, path: str, size: int) -> bool:
+    """Apply `keep` to a member path with and without its first directory."""
+    return keep(path, size) and keep(_strip_first(path), size)
+
+
+def _member_path(name: str) -> str | None:
+    """Normalize a member name, or return None if it leaves the archive."""
+    path = posixpath.normpath(name)
+    if path.startswith(("/", "../")) or path in (".", ".."):
+        return None
+    return path
+
+
+def _strip_first(path: str) -> str:
+    """Drop the first directory of a path, if it has one."""
+    return path.split("/", 1)[-1]
+
+
+def _strip_top_level(
+    members: dict[str, ArchiveMember],
+) -> dict[str, ArchiveMember]:
+    """Strip the top-level directory all members share, if any."""
+    tops = {path.partition("/")[0] for path in members}
+    if len(tops) != 1 or any("/" not in path for path in members):
+        return members
+    return {_strip_first(path): member for path, member in members.items()}
@@ -0,0 +1,86 @@
+"""Persistent cache of processed file contexts across runs."""
+
+import hashlib
+import json
+from pathlib import Path
+
+from readmeai.parsers.factory import ParserFactory
+from readmeai.preprocessor.document_cleaner import DocumentCleaner
+from readmeai.utils.disk_cache import DiskCache
+
+
+class FileContextCache:
+    """
+    Content-addressed cache of cleaned content, language and dependencies.
+
+    Entries are keyed by relative path, size, mtime and content hash. The
+    key namespace includes the cleaner and parser versions, the language
+    mapping and the sampling limit, so changing any of them orphans old
+    entries until evicted.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_bytes: int,
+        cleaner: DocumentCleaner,
+        language_names: dict[str, str],
+        max_read_size: int,
+    ) -> None:
+        self.namespace = hashlib.sha256(
+            json.dumps(
+                [
+                    DocumentCleaner.version,
+                    max_read_size,
+                    vars(cleaner),
+                    ParserFactory.version,
+                    language_names,
+                ],
+                sort_keys=True,
+            ).encode()
+        ).hexdigest()[:16]
+        self.disk_cache = DiskCache(
+            Path(directory) / "file_contexts", max_bytes
+        )
+
+    def key(
+        self,
+        relative_path: str,
+        size: int,
+        mtime_ns: int | None,
+        digest: str,
+    ) -> str:
+        """Build the cache key for a file from its stat and content hash.
+
+        Blobs read from a git tree have no modification time.
+        """
+        return (
+            f"{self.namespace}:{relative_path}:{size}:{mtime_ns}:{digest}"
+        )
+
+    def get(self, key: str) -> dict | None:
+        """Return the cached fields for a file, or None on a miss."""
+        return self.disk_cache.get(key)
+
+    def set(
+        self,
+        key: str,
+        content: str,
+        language: str,
+        dependencies: list[str],
+        sampled: bool,
+    ) -> None:
+        """Store the processed fields for a file."""
+        self.disk_cache.set(
+            key,
+            {
+                "content": content,
+                "language": language,
+                "dependencies": dependencies,
+                "sampled": sampled,
+            },
+        )
+
+    def prune(self) -> int:
+        """Evict least recently used entries above the size limit."""
+        return self.disk_cache.prune()
@@ -0,0 +1,31 @@
+"""Registry ensuring identical files are only processed once."""
+
+import threading
+from concurrent.futures import Future
+
+from readmeai.ingestion.models import FileRecord
+
+
+class BlobRegistry:
+    """
+    Thread-safe registry of file records keyed by content hash.
+
+    The first worker to claim a digest processes the file; workers
+    claiming it afterwards wait for that record and reuse it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._records: dict[str, Future] = {}
+
+    def claim(self, digest: str) -> Future | None:
+        """Claim a digest, or return the future record of an earlier claim."""
+        with self._lock:
+            if digest in self._records:
+                return self._records[digest]
+            self._records[digest] = Future()
+            return None
+
+    def resolve(self, digest: str, record: FileRecord | None) -> None:
+        """Publish the record of a claimed digest, None if it failed."""
+        self._records[digest].set_result(record)
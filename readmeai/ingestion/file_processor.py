@@ -1,13 +1,39 @@
-from collections import Counter
+import io
+import mmap
+import os
+from collections import Counter, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from dataclasses import replace
+from functools import partial
+from itertools import repeat
 from pathlib import Path
+from typing import Any
 
 from readmeai.config.settings import ConfigLoader
-from readmeai.ingestion.models import FileContext
+from readmeai.ingestion.archive import ArchiveSource
+from readmeai.ingestion.cache import FileContextCache
+from readmeai.ingestion.dedup import BlobRegistry
+from readmeai.ingestion.manifests import ManifestParser, parse_dependencies
+from readmeai.ingestion.models import FileContext, FileRecord
+from readmeai.ingestion.sources import FileSource
+from readmeai.ingestion.stats import IngestionStats
+from readmeai.ingestion.walker import RepositoryWalk, RepositoryWalker
 from readmeai.logger import get_logger
 from readmeai.parsers.factory import ParserFactory
 from readmeai.preprocessor.document_cleaner import DocumentCleaner
-from readmeai.preprocessor.file_filter import is_excluded
-from readmeai.preprocessor.file_filter import is_included
+from readmeai.preprocessor.file_reader import (
+    SNIFF_SIZE,
+    SkippedFile,
+    decode_text,
+    read_sampled,
+    sniff,
+)
 
 _logger = get_logger(__name__)
 
@@ -23,65 +49,541 @@ class FileProcessor:
         self.ignore_list = config.ignore_list.get("ignore_list", [])
         self.docs_list = config.docs_list.get("docs_list", [])
         self.language_names = config.languages.get("language_names", {})
+        self.walker = RepositoryWalker(
+            self.ignore_list,
+            self.docs_list,
+            config.config.ingestion.respect_gitignore,
+        )
+        self.max_workers = config.config.ingestion.max_workers
+        self.executor = config.config.ingestion.executor
+        self.batch_size = config.config.ingestion.batch_size
+        self.max_file_size = config.config.ingestion.max_file_size
+        self.max_read_size = config.config.ingestion.max_read_size
+        self.lazy_content = config.config.ingestion.lazy_content
+        self.use_mmap = config.config.ingestion.use_mmap
+        self.max_in_flight = config.config.ingestion.max_in_flight
+        self.deduplicate = config.config.ingestion.deduplicate
+        self.manifest_executor = config.config.ingestion.manifest_executor
+        self.cache = (
+            FileContextCache(
+                config.config.cache.directory,
+                config.config.cache.file_contexts_max_bytes,
+                self.document_cleaner,
+                self.language_names,
+                self.max_read_size,
+            )
+            if config.config.cache.directory
+            else None
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Drop the config loader when shipping the processor to workers."""
+        state = self.__dict__.copy()
+        state.pop("config", None)
+        return state
+
+    def walk(
+        self,
+        repo_path: Path,
+        source: FileSource | None = None,
+        relative_paths: Iterable[str] | None = None,
+    ) -> RepositoryWalk:
+        """Walk the repository, or a source's paths or only some, once."""
+        if source is None:
+            return self.walker.walk(repo_path)
+        walk = self.walker.walk_tree(
+            repo_path,
+            source.entries if relative_paths is None else relative_paths,
+            source.read_gitignore,
+        )
+        source.prefetch(
+            [
+                file_path.relative_to(repo_path).as_posix()
+                for file_path in walk.files
+            ]
+        )
+        walk.source = source
+        return walk
 
-    def process_files(self, repo_path: Path) -> list[FileContext]:
+    def process_files(
+        self,
+        repo_path: Path,
+        walk: RepositoryWalk | None = None,
+        stats: IngestionStats | None = None,
+        manifests: ManifestParser | None = None,
+    ) -> list[FileContext]:
         """Generate file info for the given repository path."""
+        return list(self.iter_files(repo_path, walk, stats, manifests))
+
+    def iter_files(
+        self,
+        repo_path: Path,
+        walk: RepositoryWalk | None = None,
+        stats: IngestionStats | None = None,
+        manifests: ManifestParser | None = None,
+    ) -> Iterator[FileContext]:
+        """Yield file contexts in walk order, collapsing duplicate files."""
+        walk = walk or self.walk(repo_path)
+        stats = stats or IngestionStats()
+        # Files are processed once per digest, but a context has a single
+        # name, so only copies sharing it are listed as its aliases.
+        canonical: dict[tuple[str, str], FileContext] = {}
+        for file_path, result in zip(
+            walk.files,
+            self._map_files(
+                repo_path, walk.files, stats, manifests, walk.source
+            ),
+        ):
+            if isinstance(result, FileRecord):
+                if result.digest is None or not self.deduplicate:
+                    yield result.to_context()
+                elif original := canonical.get((result.digest, result.name)):
+                    original.aliases.append(result.path)
+                else:
+                    file_context = result.to_context()
+                    canonical[result.digest, result.name] = file_context
+                    yield file_context
+            else:
+                relative_path = file_path.relative_to(repo_path).as_posix()
+                walk.skipped[relative_path] = result.reason
+                walk.skipped_bytes += result.size
+        if walk.skipped_bytes:
+            _logger.info(
+                f"Skipped reading {walk.skipped_bytes} bytes of binary, "
+                "Git LFS and oversized files"
+            )
+        if self.cache is not None:
+            self.cache.prune()
+
+    def list_files(
+        self, repo_path: Path, walk: RepositoryWalk
+    ) -> list[FileContext]:
+        """List the walked files as lazy contexts, without reading them."""
         return [
-            self._create_file_context(file_path, repo_path)
-            for file_path in repo_path.rglob("*")
-            if file_path.is_file()
-            and not is_excluded(self.ignore_list, file_path, repo_path)
+            FileRecord(
+                path=file_path.relative_to(repo_path).as_posix(),
+                name=file_path.name,
+                ext=file_path.suffix.lstrip("."),
+                language=self._map_language(
+                    file_path.suffix.lstrip("."), file_path.name
+                ),
+                loader=self._content_loader(
+                    file_path,
+                    file_path.relative_to(repo_path).as_posix(),
+                    walk.source,
+                ),
+            ).to_context()
+            for file_path in walk.files
         ]
 
-    def find_docs_files(self, repo_path: Path) -> list[str]:
+    def load_archive(self, location: str) -> ArchiveSource:
+        """Stream a tar or zip snapshot, holding only the files to ingest."""
+        return ArchiveSource.load(
+            location,
+            lambda relative_path, size: (
+                size <= self.max_file_size
+                and not self.walker.is_excluded(relative_path)
+            ),
+        )
+
+    def find_docs_files(
+        self, repo_path: Path, walk: RepositoryWalk | None = None
+    ) -> list[str]:
         """Find path to docs files"""
-        return [
-            str(path.relative_to(repo_path))
-            for path in repo_path.rglob("*")
-            if is_included(self.docs_list, path, repo_path)
-        ]
+        walk = walk or self.walk(repo_path)
+        return list(walk.docs)
 
     def count_languages(
         self, file_contexts: list[FileContext]
     ) -> dict[str, int]:
-        """Count the occurrences of each language."""
-        return dict(Counter(file.ext for file in file_contexts if file.ext))
+        """Count the occurrences of each language, including aliases."""
+        counts: Counter[str] = Counter()
+        for file in file_contexts:
+            if file.ext:
+                counts[file.ext] += 1 + len(file.aliases)
+        return dict(counts)
 
     def extract_dependencies(
         self, file_contexts: list[FileContext]
     ) -> list[str]:
-        """Extract all dependencies from file contexts."""
+        """Extract all dependencies from file contexts, ordered by path."""
         return list(
-            set().union(*(file.dependencies for file in file_contexts))
+            dict.fromkeys(
+                dependency
+                for file in sorted(file_contexts, key=lambda file: file.path)
+                for dependency in file.dependencies
+            )
         )
 
-    def _create_file_context(
-        self, file_path: Path, repo_path: Path
-    ) -> FileContext:
-        """Create a file context object for the given file path."""
-        relative_path = str(file_path.relative_to(repo_path))
-        content = file_path.read_text(errors="ignore")
+    def start_manifest_parser(self) -> ManifestParser | None:
+        """Start a process pool for manifests, if they are parsed apart."""
+        if self.manifest_executor == "inline" or self.executor == "process":
+            return None
+        return ManifestParser(self.max_workers)
+
+    def _map_files(
+        self,
+        repo_path: Path,
+        file_paths: list[Path],
+        stats: IngestionStats,
+        manifests: ManifestParser | None,
+        source: FileSource | None,
+    ) -> Iterator[FileRecord | SkippedFile]:
+        """Create file records in walk order using the configured executor."""
+        if self.executor == "process":
+            batches = [
+                file_paths[i: i + self.batch_size]
+                for i in range(0, len(file_paths), self.batch_size)
+            ]
+            # Workers get a source listing only their batch's files.
+            batch_sources = (
+                source.restrict(
+                    [
+                        file_path.relative_to(repo_path).as_posix()
+                        for file_path in batch
+                    ]
+                )
+                if source is not None
+                else None
+                for batch in batches
+            )
+            # Each batch deduplicates its own files; duplicates across
+            # batches are processed again and collapsed by the consumer.
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                for records, batch_stats in _bounded_map(
+                    pool,
+                    self._process_batch,
+                    repeat(repo_path),
+                    batches,
+                    batch_sources,
+                    window=max(self.max_in_flight // self.batch_size, 1),
+                ):
+                    stats.merge(batch_stats)
+                    yield from records
+        elif self.max_workers == 1:
+            blobs = BlobRegistry()
+            for file_path in file_paths:
+                yield self._try_create_file_record(
+                    file_path, repo_path, stats, blobs, manifests, source
+                )
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                yield from _bounded_map(
+                    pool,
+                    self._try_create_file_record,
+                    file_paths,
+                    repeat(repo_path),
+                    repeat(stats),
+                    repeat(BlobRegistry()),
+                    repeat(manifests),
+                    repeat(source),
+                    window=self.max_in_flight,
+                )
+
+    def _process_batch(
+        self,
+        repo_path: Path,
+        file_paths: list[Path],
+        source: FileSource | None,
+    ) -> tuple[list[FileRecord | SkippedFile], IngestionStats]:
+        """Create file records for a batch of paths in a worker process."""
+        stats = IngestionStats()
+        blobs = BlobRegistry()
+        records = [
+            self._try_create_file_record(
+                file_path, repo_path, stats, blobs, None, source
+            )
+            for file_path in file_paths
+        ]
+        if source is not None:
+            source.close()
+        return records, stats
+
+    def _try_create_file_record(
+        self,
+        file_path: Path,
+        repo_path: Path,
+        stats: IngestionStats,
+        blobs: BlobRegistry,
+        manifests: ManifestParser | None,
+        source: FileSource | None,
+    ) -> FileRecord | SkippedFile:
+        """Create a file record, or skip files that cannot be read."""
+        try:
+            return self._create_file_record(
+                file_path, repo_path, stats, blobs, manifests, source
+            )
+        except OSError as e:
+            _logger.error(f"Error reading file {file_path}: {e}")
+            return SkippedFile(f"unreadable: {e}")
+
+    def _create_file_record(
+        self,
+        file_path: Path,
+        repo_path: Path,
+        stats: IngestionStats,
+        blobs: BlobRegistry,
+        manifests: ManifestParser | None,
+        source: FileSource | None,
+    ) -> FileRecord | SkippedFile:
+        """Create a file record for the given file path, or skip it."""
+        relative_path = file_path.relative_to(repo_path).as_posix()
         file_ext = file_path.suffix.lstrip(".")
-        return FileContext(
+
+        opened = (
+            open(file_path, "rb")
+            if source is None
+            else source.open(relative_path)
+        )
+        with stats.measure("read") as read, opened as file:
+            read["files"] = 1
+            if source is None:
+                stat = os.fstat(file.fileno())
+                size, mtime_ns = stat.st_size, stat.st_mtime_ns
+            else:
+                size, mtime_ns = file.size, None
+            if size > self.max_file_size:
+                return SkippedFile("oversized", size)
+            prefix = file.read(SNIFF_SIZE)
+            read["bytes_read"] = len(prefix)
+            if reason := sniff(prefix):
+                return SkippedFile(reason, size - len(prefix))
+            if self.lazy_content and not ParserFactory.has_parser(
+                relative_path
+            ):
+                return FileRecord(
+                    path=relative_path,
+                    name=file_path.name,
+                    ext=file_ext,
+                    language=self._map_language(file_ext, file_path.name),
+                    loader=self._content_loader(
+                        file_path, relative_path, source
+                    ),
+                )
+            raw_content, digest, sampled = read_sampled(
+                file, prefix, self.max_read_size
+            )
+            read["bytes_read"] = size if sampled else len(raw_content)
+
+        build_record = partial(
+            self._build_file_record,
+            file_path,
+            relative_path,
+            (
+                self.cache.key(relative_path, size, mtime_ns, digest)
+                if self.cache is not None
+                else None
+            ),
+            raw_content,
+            digest,
+            sampled,
+            stats,
+            manifests,
+        )
+        if not self.deduplicate:
+            return build_record()
+
+        original = blobs.claim(digest)
+        if original is None:
+            file_record = None
+            try:
+                file_record = build_record()
+            finally:
+                blobs.resolve(digest, file_record)
+            return file_record
+        if (file_record := original.result()) is not None:
+            return self._copy_file_record(
+                file_record,
+                file_path,
+                relative_path,
+                raw_content,
+                stats,
+                manifests,
+            )
+        return build_record()
+
+    def _copy_file_record(
+        self,
+        file_record: FileRecord,
+        file_path: Path,
+        relative_path: str,
+        raw_content: bytes,
+        stats: IngestionStats,
+        manifests: ManifestParser | None,
+    ) -> FileRecord:
+        """Reuse the record of a byte-identical file for another path."""
+        if file_path.name == file_record.name:
+            return replace(file_record, path=relative_path)
+
+        # Parsers are picked by file name, so only the cleaning is shared.
+        file_ext = file_path.suffix.lstrip(".")
+        dependencies = []
+        if ParserFactory.has_parser(relative_path):
+            content = decode_text(raw_content)
+            if manifests is None:
+                dependencies = parse_dependencies(
+                    relative_path, content, stats
+                )
+            else:
+                manifests.submit(relative_path, content)
+        return replace(
+            file_record,
+            path=relative_path,
+            name=file_path.name,
+            ext=file_ext,
+            language=self._map_language(file_ext, file_path.name),
+            dependencies=dependencies,
+        )
+
+    def _build_file_record(
+        self,
+        file_path: Path,
+        relative_path: str,
+        cache_key: str | None,
+        raw_content: bytes,
+        digest: str,
+        sampled: bool,
+        stats: IngestionStats,
+        manifests: ManifestParser | None,
+    ) -> FileRecord:
+        """Clean and parse the content read for a file, or load it cached."""
+        file_ext = file_path.suffix.lstrip(".")
+
+        if cache_key is not None:
+            if cached := self.cache.get(cache_key):
+                return FileRecord(
+                    path=relative_path,
+                    name=file_path.name,
+                    ext=file_ext,
+                    digest=digest,
+                    **cached,
+                )
+
+        content = decode_text(raw_content)
+        dependencies = []
+        deferred = False
+        if ParserFactory.has_parser(relative_path):
+            if manifests is None:
+                dependencies = parse_dependencies(
+                    relative_path, content, stats
+                )
+            else:
+                manifests.submit(relative_path, content)
+                deferred = True
+        with stats.measure("clean") as clean:
+            cleaned_content = self.document_cleaner.clean(content)
+            clean["files"] = 1
+            clean["bytes_cleaned"] = len(cleaned_content.encode())
+
+        file_record = FileRecord(
             path=relative_path,
             name=file_path.name,
             ext=file_ext,
-            content=self.document_cleaner.clean(content),
             language=self._map_language(file_ext, file_path.name),
-            dependencies=self._parse_dependencies(relative_path, content),
+            dependencies=dependencies,
+            sampled=sampled,
+            content=cleaned_content,
+            digest=digest,
+        )
+        # Deferred manifests have no dependencies until the parser is done.
+        if cache_key is not None and not deferred:
+            self.cache.set(
+                cache_key,
+                file_record.content,
+                file_record.language,
+                file_record.dependencies,
+                file_record.sampled,
+            )
+        return file_record
+
+    def _content_loader(
+        self,
+        file_path: Path,
+        relative_path: str,
+        source: FileSource | None,
+    ) -> Callable[[], tuple[str, bool]]:
+        """Return a loader reading a file's content on demand."""
+        if source is not None:
+            return partial(
+                load_source_content,
+                source,
+                relative_path,
+                self.document_cleaner,
+                self.max_read_size,
+            )
+        return partial(
+            load_file_content,
+            file_path,
+            self.document_cleaner,
+            self.max_read_size,
+            self.use_mmap,
         )
 
     def _map_language(self, file_ext: str, file_name: str) -> str:
         """Map the file extension to the programming language name."""
         return self.language_names.get(file_ext, file_name)
 
-    def _parse_dependencies(self, file_path: str, content: str) -> list[str]:
-        """Parse dependencies from the file content."""
-        if parser := ParserFactory.create_parser(file_path):
-            try:
-                return parser.parse(content) or []
-            except Exception as e:
-                _logger.error(
-                    f"Error parsing dependency file {file_path}: {e}"
+
+class _MappedReader(io.RawIOBase):
+    """Raw stream over a memory map, so reads can be buffered and capped."""
+
+    def __init__(self, mapped: mmap.mmap) -> None:
+        self.mapped = mapped
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self.mapped.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def load_file_content(
+    file_path: Path,
+    document_cleaner: DocumentCleaner,
+    max_read_size: int,
+    use_mmap: bool = False,
+) -> tuple[str, bool]:
+    """Read and clean a file on demand, returning content and sampled flag."""
+    with open(file_path, "rb") as file:
+        if use_mmap and os.fstat(file.fileno()).st_size:
+            with mmap.mmap(
+                file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mapped:
+                raw_content, _, sampled = read_sampled(
+                    io.BufferedReader(_MappedReader(mapped)),
+                    b"",
+                    max_read_size,
                 )
-        return []
+        else:
+            raw_content, _, sampled = read_sampled(file, b"", max_read_size)
+    return document_cleaner.clean(decode_text(raw_content)), sampled
+
+
+def load_source_content(
+    source: FileSource,
+    relative_path: str,
+    document_cleaner: DocumentCleaner,
+    max_read_size: int,
+) -> tuple[str, bool]:
+    """Read and clean a file of a source on demand."""
+    with source.open(relative_path) as file:
+        raw_content, _, sampled = read_sampled(file, b"", max_read_size)
+    return document_cleaner.clean(decode_text(raw_content)), sampled
+
+
+def _bounded_map(
+    pool: Executor,
+    fn: Callable[..., Any],
+    *iterables: Iterable[Any],
+    window: int,
+) -> Iterator[Any]:
+    """Like Executor.map, but with at most `window` tasks pending at once."""
+    pending: deque[Future] = deque()
+    for args in zip(*iterables):
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(pool.submit(fn, *args))
+    while pending:
+        yield pending.popleft().result()
@@ -0,0 +1,232 @@
+"""Ingestion source reading a commit straight from the git object database."""
+
+import re
+import tempfile
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple
+
+import git
+
+from readmeai.errors import RepositoryProcessingError
+from readmeai.ingestion.sources import FileSource
+
+# Blob modes of regular files; symlinks (120000) and submodules (160000)
+# are not ingested.
+_FILE_MODES = frozenset({"100644", "100755"})
+_BLOB_LIMIT_PATTERN = re.compile(r"blob:limit=(\d+)([kmgKMG]?)")
+_CHUNK_SIZE = 64 * 1024
+
+
+class TreeEntry(NamedTuple):
+    """
+    A regular file of the tree, by blob id and size in bytes if listed.
+    """
+
+    object_id: str
+    size: int | None
+
+
+class GitTreeSource(FileSource):
+    """
+    The files of one commit, listed with `git ls-tree -r -l`.
+
+    Blobs are streamed on demand through GitPython's long-lived
+    `git cat-file --batch` process, so nothing is checked out and ignored
+    or oversized files are never read. The process is shared by all
+    threads behind a lock, and worker processes each start their own.
+
+    In a partial clone, listing sizes would fetch every missing blob one
+    at a time, so only the sizes of blobs already there are looked up,
+    and the blobs to read are fetched in one batch with `prefetch`. Blobs
+    left out by a `blob:limit=<n>` filter are only known to be larger than
+    n bytes, and are listed with n + 1 so they are never fetched.
+    """
+
+    def __init__(self, repo_path: Path | str, revision: str = "HEAD") -> None:
+        self.repo_path = Path(repo_path)
+        self.revision = revision
+        self._lock = threading.Lock()
+        self._repo: git.Repo | None = None
+        try:
+            self.commit = self.repo.commit(revision).hexsha
+            self.promisor = next(
+                (
+                    remote.name
+                    for remote in self.repo.remotes
+                    if remote.config_reader.get_value("promisor", False)
+                ),
+                None,
+            )
+            sizes = () if self.promisor else ("-l",)
+            listing = self.repo.git.ls_tree(
+                "-r", *sizes, "-z", "--full-tree", self.commit
+            )
+            self.entries = _parse_ls_tree(listing)
+            if self.promisor:
+                self._list_partial_sizes()
+        except (git.GitError, ValueError) as exc:
+            raise RepositoryProcessingError(
+                f"Error listing {revision} in {repo_path}: {exc}"
+            ) from exc
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Leave the repository and its processes out of pickles."""
+        state = self.__dict__.copy()
+        state.update(_lock=None, _repo=None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def repo(self) -> git.Repo:
+        """The repository, opened on first use in each process."""
+        if self._repo is None:
+            self._repo = git.Repo(self.repo_path)
+        return self._repo
+
+    def size(self, relative_path: str) -> int:
+        """Return the size of a file in bytes, without reading it."""
+        entry = self.entries[relative_path]
+        if entry.size is not None:
+            return entry.size
+        with self._lock:
+            try:
+                return self.repo.git.get_object_header(entry.object_id)[2]
+            except (git.GitError, ValueError) as exc:
+                raise OSError(
+                    f"Error reading {relative_path} from {self.commit}: {exc}"
+                ) from exc
+
+    def read(self, relative_path: str) -> bytes:
+        """Read the content of a file from the object database."""
+        with self.stream(relative_path) as stream:
+            return stream.read()
+
+    @contextmanager
+    def stream(self, relative_path: str) -> Iterator[BinaryIO]:
+        """Stream a blob from the cat-file process, holding it meanwhile.
+
+        The process answers one request at a time, so whatever is left
+        unread, e.g. past the sniffed prefix of a binary file, is drained
+        in chunks before the next request.
+        """
+        try:
+            entry = self.entries[relative_path]
+        except KeyError:
+            raise FileNotFoundError(
+                f"{relative_path} is not in {self.commit}"
+            ) from None
+        with self._lock:
+            try:
+                *_, stream = self.repo.git.stream_object_data(entry.object_id)
+            except (git.GitError, ValueError) as exc:
+                raise OSError(
+                    f"Error reading {relative_path} from {self.commit}: {exc}"
+                ) from exc
+            try:
+                yield stream
+            finally:
+                while stream.read(_CHUNK_SIZE):
+                    pass
+
+    def prefetch(self, relative_paths: list[str]) -> None:
+        """Fetch the missing blobs of files in one request."""
+        object_ids = "".join(
+            f"{self.entries[path].object_id}\n"
+            for path in relative_paths
+            if self.entries[path].size is None
+        )
+        if not self.promisor or not object_ids:
+            return
+        with self._lock, tempfile.TemporaryFile() as stdin:
+            stdin.write(object_ids.encode())
+            stdin.seek(0)
+            try:
+                # Like git's own lazy fetches, but for all blobs at once.
+                self.repo.git(c="fetch.negotiationAlgorithm=noop").fetch(
+                    "--no-tags",
+                    "--no-write-fetch-head",
+                    "--recurse-submodules=no",
+                    "--filter=blob:none",
+                    "--stdin",
+                    self.promisor,
+                    istream=stdin,
+                )
+            except git.GitCommandError as exc:
+                raise RepositoryProcessingError(
+                    f"Error fetching files of {self.commit}: {exc}"
+                ) from exc
+
+    def _list_partial_sizes(self) -> None:
+        """Fill in entry sizes of a partial clone without fetching blobs."""
+        missing = {
+            line[1:]
+            for line in self.repo.git.rev_list(
+                "--objects", "--missing=print", "--no-walk", self.commit
+            ).splitlines()
+            if line.startswith("?")
+        }
+        present = "".join(
+            f"{entry.object_id}\n"
+            for entry in self.entries.values()
+            if entry.object_id not in missing
+        )
+        with tempfile.TemporaryFile() as stdin:
+            stdin.write(present.encode())
+            stdin.seek(0)
+            headers = self.repo.git.cat_file(
+                "--batch-check=%(objectname) %(objectsize)", istream=stdin
+            )
+        sizes = dict(line.split() for line in headers.splitlines())
+
+        limit = _blob_limit(
+            self.repo.config_reader().get_value(
+                f'remote "{self.promisor}"', "partialclonefilter", ""
+            )
+        )
+        oversized = None if limit is None else limit + 1
+        self.entries = {
+            path: entry._replace(
+                size=(
+                    int(sizes[entry.object_id])
+                    if entry.object_id in sizes
+                    else oversized
+                )
+            )
+            for path, entry in self.entries.items()
+        }
+
+    def close(self) -> None:
+        """Stop the cat-file process."""
+        if self._repo is not None:
+            self._repo.close()
+            self._repo = None
+
+
+def _parse_ls_tree(listing: str) -> dict[str, TreeEntry]:
+    """Parse `git ls-tree -r -z` output, with or without sizes (`-l`)."""
+    entries = {}
+    for record in listing.split("\0"):
+        if not record:
+            continue
+        info, _, path = record.partition("\t")
+        mode, object_type, object_id, *size = info.split()
+        if object_type == "blob" and mode in _FILE_MODES:
+            entries[path] = TreeEntry(
+                object_id, int(size[0]) if size else None
+            )
+    return entries
+
+
+def _blob_limit(object_filter: str) -> int | None:
+    """Return the size limit in bytes of a `blob:limit=<n>[kmg]` filter."""
+    match = _BLOB_LIMIT_PATTERN.fullmatch(str(object_filter))
+    if match is None:
+        return None
+    number, unit = match.groups()
+    return int(number) * 1024 ** " kmg".index(unit.lower() or " ")
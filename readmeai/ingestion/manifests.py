@@ -0,0 +1,74 @@
+"""Dependency manifest parsing, inline or in a dedicated process pool."""
+
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from readmeai.ingestion.stats import IngestionStats
+from readmeai.logger import get_logger
+from readmeai.parsers.factory import ParserFactory
+
+_logger = get_logger(__name__)
+
+
+def parse_dependencies(
+    file_path: str, content: str, stats: IngestionStats
+) -> list[str]:
+    """Parse dependencies from a manifest, timing it per parser type."""
+    parser = ParserFactory.create_parser(file_path)
+    with (
+        stats.measure("parse") as total,
+        stats.measure(f"parse:{type(parser).__name__}") as by_type,
+    ):
+        total["files"] = by_type["files"] = 1
+        try:
+            return parser.parse(content) or []
+        except Exception as e:
+            _logger.error(f"Error parsing dependency file {file_path}: {e}")
+            return []
+
+
+class ManifestParser:
+    """
+    Parses dependency manifests in a process pool of their own.
+
+    YAML, TOML and XML parsing is CPU-bound, so file workers running as
+    threads hand the manifests they read over to this pool instead of
+    parsing them under the GIL. Results are keyed by path, so merging them
+    does not depend on the order in which workers finish.
+    """
+
+    def __init__(self, max_workers: int | None) -> None:
+        self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        self._lock = threading.Lock()
+        self._futures: dict[str, Future] = {}
+
+    def submit(self, file_path: str, content: str) -> None:
+        """Queue a manifest for parsing; safe to call from any thread."""
+        future = self._executor.submit(_parse_manifest, file_path, content)
+        with self._lock:
+            self._futures[file_path] = future
+
+    def result(self, stats: IngestionStats) -> dict[str, list[str]]:
+        """Wait for all manifests and return their dependencies by path."""
+        dependencies: dict[str, list[str]] = {}
+        try:
+            for file_path in sorted(self._futures):
+                dependencies[file_path], manifest_stats = self._futures[
+                    file_path
+                ].result()
+                stats.merge(manifest_stats)
+        finally:
+            self._executor.shutdown()
+        return dependencies
+
+    def cancel(self) -> None:
+        """Drop queued manifests and shut the pool down."""
+        self._executor.shutdown(cancel_futures=True)
+
+
+def _parse_manifest(
+    file_path: str, content: str
+) -> tuple[list[str], IngestionStats]:
+    """Parse one manifest in a worker process."""
+    stats = IngestionStats()
+    return parse_dependencies(file_path, content, stats), stats
@@ -1,8 +1,96 @@
 import fnmatch
+import os
+import re
 
 from readmeai.config.settings import ConfigLoader
 from readmeai.ingestion.models import FileContext
 
+METADATA_CATEGORIES = (
+    "cicd",
+    "containers",
+    "documentation",
+    "package_managers",
+)
+
+
+class ToolPatternIndex:
+    """
+    Tool file patterns compiled once into lookup tables.
+
+    `prefix*` patterns match the start of a path, `*suffix` patterns and
+    plain names match its end, and patterns with other wildcards go through
+    fnmatch behind a single combined regex. Prefixes and suffixes are
+    grouped by length, so each path costs one dict lookup per distinct
+    length instead of one string comparison per pattern.
+    """
+
+    def __init__(self, tool_definitions: dict[str, list[str]]) -> None:
+        self.tools = list(tool_definitions)
+        self.prefixes: dict[int, dict[str, list[int]]] = {}
+        self.suffixes: dict[int, dict[str, list[int]]] = {}
+        self.globs: list[tuple[str, int]] = []
+
+        for tool_index, patterns in enumerate(tool_definitions.values()):
+            for pattern in patterns:
+                if pattern.endswith("*"):
+                    self._add(self.prefixes, pattern.rstrip("*"), tool_index)
+                elif pattern.startswith("*"):
+                    self._add(self.suffixes, pattern[1:], tool_index)
+                elif "*" in pattern:
+                    self.globs.append((pattern, tool_index))
+                else:
+                    self._add(self.suffixes, pattern, tool_index)
+
+        # Every suffix ends with one of these tails, so most paths are
+        # rejected with a single lookup.
+        self.tail_size = min(self.suffixes, default=0)
+        self.tails = {
+            suffix[len(suffix) - self.tail_size :]
+            for table in self.suffixes.values()
+            for suffix in table
+        }
+        self.glob_filter = (
+            re.compile(
+                "|".join(
+                    fnmatch.translate(os.path.normcase(pattern))
+                    for pattern, _ in self.globs
+                )
+            )
+            if self.globs
+            else None
+        )
+
+    def match(self, file_path: str) -> list[str]:
+        """Return the tool of every matching pattern, in definition order."""
+        matches = []
+        for length, table in self.prefixes.items():
+            matches.extend(table.get(file_path[:length], ()))
+        if not self.tail_size or (
+            file_path[-self.tail_size :] in self.tails
+        ):
+            for length, table in self.suffixes.items():
+                matches.extend(
+                    table.get(file_path[-length:] if length else "", ())
+                )
+        if self.glob_filter is not None and self.glob_filter.match(
+            os.path.normcase(file_path)
+        ):
+            matches.extend(
+                tool_index
+                for pattern, tool_index in self.globs
+                if fnmatch.fnmatch(file_path, pattern)
+            )
+        if not matches:
+            return matches
+        return [self.tools[tool_index] for tool_index in sorted(matches)]
+
+    @staticmethod
+    def _add(
+        table: dict[int, dict[str, list[int]]], key: str, tool_index: int
+    ) -> None:
+        """Register a tool under a prefix or suffix, grouped by length."""
+        table.setdefault(len(key), {}).setdefault(key, []).append(tool_index)
+
 
 class MetadataExtractor:
     """
@@ -11,57 +99,38 @@ class MetadataExtractor:
 
     def __init__(self, config: ConfigLoader) -> None:
         self.config = config
+        self.tool_indexes = {
+            category: ToolPatternIndex(config.tooling.get(category, {}))
+            for category in METADATA_CATEGORIES
+        }
 
     def extract_metadata(
         self, file_contexts: list[FileContext]
     ) -> dict[str, dict[str, str]]:
         """Extract metadata from file contexts."""
-        metadata_categories = {
-            "cicd": "cicd",
-            "containers": "containers",
-            "documentation": "documentation",
-            "package_managers": "package_managers",
-        }
         return {
             category: self._convert_to_string(
-                self._detect_tools(
-                    file_contexts, self.config.tooling.get(tool_config, {})
-                )
+                self._detect_tools(file_contexts, tool_index)
             )
-            for category, tool_config in metadata_categories.items()
+            for category, tool_index in self.tool_indexes.items()
         }
 
     def _detect_tools(
-        self, files: list[FileContext], tool_definitions: dict[str, list[str]]
+        self, files: list[FileContext], tool_index: ToolPatternIndex
     ) -> dict[str, list[str]]:
-        """Detect tools based on file patterns."""
+        """Detect tools based on file patterns.
+
+        A file is listed once per pattern of a tool that it matches.
+        """
         detected_tools: dict[str, list[str]] = {}
 
         for file in files:
-            for tool, patterns in tool_definitions.items():
-                if matching_files := [
-                    file.path
-                    for pattern in patterns
-                    if self._match_file_pattern(file.path, pattern)
-                ]:
-                    if tool not in detected_tools:
-                        detected_tools[tool] = []
-                    detected_tools[tool].extend(matching_files)
+            for file_path in (file.path, *file.aliases):
+                for tool in tool_index.match(file_path):
+                    detected_tools.setdefault(tool, []).append(file_path)
 
         return detected_tools
 
-    def _match_file_pattern(self, file_path: str, pattern: str) -> bool:
-        """
-        Match a file path against a pattern.
-        """
-        if pattern.endswith("*"):
-            return file_path.startswith(pattern.rstrip("*"))
-        elif pattern.startswith("*"):
-            return file_path.endswith(pattern[1:])
-        elif "*" in pattern:
-            return fnmatch.fnmatch(file_path, pattern)
-        return file_path.endswith(pattern)
-
     def _convert_to_string(
         self, tool_files: dict[str, list[str]]
     ) -> dict[str, str]:
@@ -1,6 +1,14 @@
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import Annotated, Any
 
-from pydantic import BaseModel, Field, StringConstraints
+from pydantic import (
+    BaseModel,
+    Field,
+    PrivateAttr,
+    StringConstraints,
+    computed_field,
+)
 
 
 class QuickStart(BaseModel):
@@ -19,19 +27,120 @@ class QuickStart(BaseModel):
 class FileContext(BaseModel):
     """
     FileContext model for storing file information.
+
+    The content is either given up front or produced on first access by a
+    loader returning the content and whether it was sampled. The digest
+    of the file's bytes is kept if they were read during ingestion.
+    Aliases are the paths of byte-identical files with the same name,
+    collapsed into this one.
     """
 
     path: str
     name: str
     ext: str
-    content: str
     language: Annotated[str, StringConstraints(to_lower=True)]
     dependencies: Annotated[list[str], Field(default_factory=list)]
+    sampled: bool = False
+    aliases: Annotated[list[str], Field(default_factory=list)]
+    digest: str | None = None
+
+    _content: str | None = PrivateAttr(default=None)
+    _loader: Callable[[], tuple[str, bool]] | None = PrivateAttr(default=None)
+
+    def __init__(
+        self,
+        content: str | None = None,
+        loader: Callable[[], tuple[str, bool]] | None = None,
+        **data: Any,
+    ) -> None:
+        super().__init__(**data)
+        self.__pydantic_private__.update(_content=content, _loader=loader)
+
+    @computed_field
+    @property
+    def content(self) -> str:
+        """File content, loaded from disk on first access if lazy."""
+        if self._content is None and self._loader is not None:
+            self._content, self.sampled = self._loader()
+        return self._content or ""
+
+    @content.setter
+    def content(self, content: str) -> None:
+        self._content = content
+
+
+# Shared by converted FileContexts: it holds every field, so assigning
+# one leaves it unchanged.
+_FILE_CONTEXT_FIELDS = set(FileContext.model_fields)
+
+
+@dataclass(slots=True)
+class FileRecord:
+    """
+    Compact file record used during ingestion, converted to FileContext.
+    """
+
+    path: str
+    name: str
+    ext: str
+    language: str
+    dependencies: list[str] = field(default_factory=list)
+    sampled: bool = False
+    content: str | None = None
+    loader: Callable[[], tuple[str, bool]] | None = None
+    digest: str | None = None
+
+    def to_context(self) -> FileContext:
+        """Build the FileContext model without revalidating the fields."""
+        file_context = FileContext.__new__(FileContext)
+        object.__setattr__(
+            file_context,
+            "__dict__",
+            {
+                "path": self.path,
+                "name": self.name,
+                "ext": self.ext,
+                "language": self.language.lower(),
+                "dependencies": self.dependencies,
+                "sampled": self.sampled,
+                "aliases": [],
+                "digest": self.digest,
+            },
+        )
+        object.__setattr__(
+            file_context, "__pydantic_fields_set__", _FILE_CONTEXT_FIELDS
+        )
+        object.__setattr__(file_context, "__pydantic_extra__", None)
+        object.__setattr__(
+            file_context,
+            "__pydantic_private__",
+            {
+                "_content": self.content,
+                "_loader": self.loader,
+            },
+        )
+        return file_context
+
+
+class StageStats(BaseModel):
+    """
+    Figures for one ingestion stage. Times of per-file stages are summed
+    over all workers, so they can exceed the elapsed time.
+    """
+
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    files: int = 0
+    bytes_read: int = 0
+    bytes_cleaned: int = 0
 
 
 class RepositoryContext(BaseModel):
     """
-    RepositoryContext model for storing repository information
+    RepositoryContext model for storing repository information.
+
+    Paths are relative to `root`, the directory of the repository the
+    context covers, e.g. a workspace package, or empty for all of it.
     """
 
     files: list[FileContext]
@@ -41,3 +150,12 @@ class RepositoryContext(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict)
     quickstart: QuickStart = Field(default_factory=QuickStart)
     docs_paths: list[str]
+    commit_sha: str | None = None
+    skipped_files: dict[str, str] = Field(default_factory=dict)
+    skipped_bytes: int = 0
+    ingestion_stats: dict[str, StageStats] = Field(default_factory=dict)
+    root: str = ""
+
+    def repository_path(self, path: str) -> str:
+        """Return a path of the context relative to the repository root."""
+        return f"{self.root}/{path}" if self.root else path
@@ -1,10 +1,53 @@
+import posixpath
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
+import git
+
 from readmeai.config.settings import ConfigLoader
+from readmeai.errors import RepositoryProcessingError
 from readmeai.generators.quickstart import QuickStartGenerator
 from readmeai.ingestion.file_processor import FileProcessor
+from readmeai.ingestion.git_tree import GitTreeSource
 from readmeai.ingestion.metadata_extractor import MetadataExtractor
-from readmeai.ingestion.models import RepositoryContext
+from readmeai.ingestion.models import FileContext, RepositoryContext
+from readmeai.ingestion.sources import FileSource
+from readmeai.ingestion.stats import IngestionStats
+from readmeai.ingestion.walker import RepositoryWalk
+from readmeai.ingestion.workspaces import (
+    WorkspacePackage,
+    find_workspace_packages,
+)
+from readmeai.logger import get_logger
+
+_logger = get_logger(__name__)
+
+
+class RepositoryStream:
+    """
+    Repository ingestion running in a background thread.
+
+    `context` is available as soon as the walk is done. It lists the walked
+    files as lazy file contexts, which may include files later skipped as
+    binary, and has no dependencies or metadata yet. `result` waits for
+    ingestion to finish and completes the same context in place.
+    """
+
+    def __init__(
+        self,
+        context: RepositoryContext,
+        ingest: Callable[[], RepositoryContext],
+    ) -> None:
+        self.context = context
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._future = executor.submit(ingest)
+        executor.shutdown(wait=False)
+
+    def result(self) -> RepositoryContext:
+        """Wait for ingestion to finish and return the complete context."""
+        return self._future.result()
 
 
 class RepositoryProcessor:
@@ -19,34 +62,444 @@ class RepositoryProcessor:
         self.quickstart_generator = QuickStartGenerator(config)
 
     def process_repository(
-        self, repo_path: Path | str | None = None
+        self,
+        repo_path: Path | str | None = None,
+        revision: str | None = None,
+        source: FileSource | None = None,
     ) -> RepositoryContext:
-        """Process the repository and extract metadata."""
+        """Process the repository and extract metadata.
+
+        With a revision, the files of that commit are read straight from
+        the git object database instead of the work tree, which may then
+        be missing altogether, as in a bare clone. Files can also be read
+        from another source, e.g. an archive, with `repo_path` only naming
+        the root they are reported under.
+        """
+        repo_path = Path(str(repo_path))
+        stats = IngestionStats()
+
+        walk = self._walk(repo_path, stats, revision, source)
+        try:
+            file_contexts = self._process_files(repo_path, walk, stats)
+        finally:
+            if walk.source is not None:
+                walk.source.close()
+        context = self._create_context(repo_path, walk, file_contexts)
+        self._finish(context, stats)
+        return context
+
+    def stream_repository(
+        self,
+        repo_path: Path | str | None = None,
+        revision: str | None = None,
+        source: FileSource | None = None,
+    ) -> RepositoryStream:
+        """Walk the repository and process its files in the background.
+
+        Callers can start working with the paths in the returned stream's
+        context, e.g. prompting for file summaries, while file contents
+        are read, cleaned and parsed. A revision or a source is read as in
+        `process_repository`. Until processing completes, the context lists
+        every walked file: byte-identical duplicates are only collapsed
+        into aliases once their contents are known.
+        """
+        repo_path = Path(str(repo_path))
+        stats = IngestionStats()
+
+        walk = self._walk(repo_path, stats, revision, source)
+        context = self._create_context(
+            repo_path, walk, self.file_processor.list_files(repo_path, walk)
+        )
+        return RepositoryStream(
+            context,
+            partial(self._complete_stream, context, repo_path, walk, stats),
+        )
+
+    def process_workspace(
+        self,
+        repo_path: Path | str | None = None,
+        revision: str | None = None,
+        source: FileSource | None = None,
+    ) -> tuple[RepositoryContext, dict[WorkspacePackage, RepositoryContext]]:
+        """Process a monorepo once and split it into its workspace packages.
+
+        The repository is ingested as a whole, then every package gets a
+        context of its own, re-rooted at the package directory, that shares
+        the processed files and parsed manifests. No packages are returned
+        when the repository declares no workspace. A revision or a source
+        is read as in `process_repository`.
+        """
         repo_path = Path(str(repo_path))
+        context = self.process_repository(repo_path, revision, source)
 
-        file_contexts = self.file_processor.process_files(repo_path)
+        file_paths = (
+            path
+            for file in context.files
+            for path in (file.path, *file.aliases)
+        )
+        if source is None and revision is not None:
+            source = GitTreeSource(repo_path, context.commit_sha)
+        packages = find_workspace_packages(
+            repo_path, file_paths, source and source.read_text
+        )
+        if source is not None:
+            source.close()
+        package_contexts = {
+            package: self._package_context(context, package)
+            for package in packages
+        }
+        _logger.info(
+            f"Found {len(packages)} workspace packages",
+            packages=[package.path for package in packages],
+        )
+        return context, package_contexts
+
+    def update_repository(
+        self,
+        context: RepositoryContext,
+        repo_path: Path | str,
+        previous_sha: str | None = None,
+        current_sha: str = "HEAD",
+    ) -> RepositoryContext:
+        """Patch a previous context in place with the changes since a commit.
+
+        Only files reported by `git diff --name-status` between the two
+        commits are reprocessed, reading them from `current_sha` in the
+        object database, whatever the work tree holds. `previous_sha`
+        defaults to the commit the context was built from. A changed
+        .gitignore file can change what is ignored among unchanged files,
+        so the repository is then processed again as a whole.
+        """
+        repo_path = Path(str(repo_path))
+        previous_sha = previous_sha or context.commit_sha
+        if not previous_sha:
+            raise RepositoryProcessingError(
+                "A previous commit SHA is required for incremental updates."
+            )
+
+        try:
+            repo = git.Repo(repo_path)
+            current_sha = repo.commit(current_sha).hexsha
+            diff = repo.git.diff(
+                "--name-status", "-z", f"{previous_sha}..{current_sha}"
+            )
+        except (git.GitError, ValueError) as exc:
+            raise RepositoryProcessingError(
+                f"Error diffing {repo_path} from {previous_sha}: {exc}"
+            ) from exc
+
+        removed, changed = _parse_name_status(diff)
+        if any(
+            posixpath.basename(path) == ".gitignore"
+            for path in removed | changed
+        ):
+            _logger.info(
+                f"Ignore rules changed in {previous_sha[:12]}.."
+                f"{current_sha[:12]}, processing the whole repository"
+            )
+            rebuilt = self.process_repository(repo_path, current_sha)
+            for name in RepositoryContext.model_fields:
+                setattr(context, name, getattr(rebuilt, name))
+            return context
+
+        _logger.info(
+            f"Incremental update {previous_sha[:12]}..{current_sha[:12]}: "
+            f"{len(changed)} changed, {len(removed)} removed files"
+        )
+
+        stats = IngestionStats()
+        source = GitTreeSource(repo_path, current_sha)
+        try:
+            with stats.measure("walk") as figures:
+                walk = self._walk_changes(repo_path, source, changed)
+                figures["files"] = len(walk.files)
+            updated = self._process_files(repo_path, walk, stats)
+        finally:
+            source.close()
+
+        stale = removed | changed
+        files = {}
+        for file in context.files:
+            aliases = [path for path in file.aliases if path not in stale]
+            if file.path not in stale:
+                file.aliases = aliases
+                files[file.path] = file
+            elif aliases:
+                # The first remaining alias takes over the unchanged blob.
+                files[aliases[0]] = file.model_copy(
+                    update={"path": aliases[0], "aliases": aliases[1:]}
+                )
+        files.update((file.path, file) for file in updated)
+        context.files = sorted(
+            files.values(), key=lambda file: _walk_order(file.path)
+        )
+        if self.file_processor.deduplicate:
+            context.files = _collapse_duplicates(context.files)
+
+        docs = set(context.docs_paths).difference(removed).union(walk.docs)
+        context.docs_paths = sorted(docs, key=_walk_order)
+        context.commit_sha = current_sha
+        for path in stale:
+            context.skipped_files.pop(path, None)
+        context.skipped_files.update(walk.skipped)
+
+        self._finish(context, stats)
+        return context
+
+    def _create_context(
+        self,
+        repo_path: Path,
+        walk: RepositoryWalk,
+        file_contexts: list[FileContext],
+    ) -> RepositoryContext:
+        """Build a context from a walk, without the derived summary."""
+        return RepositoryContext(
+            files=file_contexts,
+            dependencies=[],
+            languages=[],
+            language_counts={},
+            docs_paths=self.file_processor.find_docs_files(repo_path, walk),
+            commit_sha=(
+                walk.source.commit
+                if walk.source is not None
+                else self._resolve_commit(repo_path)
+            ),
+            skipped_files=walk.skipped,
+            skipped_bytes=walk.skipped_bytes,
+        )
+
+    def _package_context(
+        self, context: RepositoryContext, package: WorkspacePackage
+    ) -> RepositoryContext:
+        """Slice a package out of a repository context, re-rooted at it.
+
+        Paths become relative to the package, while its `root` keeps links
+        built from them pointing into the repository.
+        """
+        prefix = f"{package.path}/"
+        files = []
+        for file in context.files:
+            paths = [
+                path.removeprefix(prefix)
+                for path in (file.path, *file.aliases)
+                if path.startswith(prefix)
+            ]
+            if paths:
+                files.append(
+                    file.model_copy(
+                        update={"path": paths[0], "aliases": paths[1:]}
+                    )
+                )
+
+        package_context = RepositoryContext(
+            files=files,
+            dependencies=[],
+            languages=[],
+            language_counts={},
+            docs_paths=[
+                path.removeprefix(prefix)
+                for path in context.docs_paths
+                if path.startswith(prefix)
+            ],
+            commit_sha=context.commit_sha,
+            skipped_files={
+                path.removeprefix(prefix): reason
+                for path, reason in context.skipped_files.items()
+                if path.startswith(prefix)
+            },
+            ingestion_stats=context.ingestion_stats,
+            root=context.repository_path(package.path),
+        )
+        self._update_summary(package_context)
+        return package_context
+
+    def _complete_stream(
+        self,
+        context: RepositoryContext,
+        repo_path: Path,
+        walk: RepositoryWalk,
+        stats: IngestionStats,
+    ) -> RepositoryContext:
+        """Process the walked files and complete a streamed context."""
+        try:
+            context.files = self._process_files(repo_path, walk, stats)
+        finally:
+            if walk.source is not None:
+                walk.source.close()
+        context.skipped_files = walk.skipped
+        context.skipped_bytes = walk.skipped_bytes
+        self._finish(context, stats)
+        return context
+
+    def _process_files(
+        self, repo_path: Path, walk: RepositoryWalk, stats: IngestionStats
+    ) -> list[FileContext]:
+        """Process the walked files, parsing manifests apart if enabled.
+
+        Dependencies from the manifest parser are assigned by path once the
+        file workers and the manifest parser have both finished.
+        """
+        manifests = self.file_processor.start_manifest_parser()
+        try:
+            file_contexts = self.file_processor.process_files(
+                repo_path, walk, stats, manifests
+            )
+        except BaseException:
+            if manifests is not None:
+                manifests.cancel()
+            raise
+        if manifests is not None:
+            dependencies = manifests.result(stats)
+            for file in file_contexts:
+                if file.path in dependencies:
+                    file.dependencies = dependencies[file.path]
+        return file_contexts
+
+    def _walk(
+        self,
+        repo_path: Path,
+        stats: IngestionStats,
+        revision: str | None = None,
+        source: FileSource | None = None,
+    ) -> RepositoryWalk:
+        """Walk the repository or a snapshot of it, timing the walk stage."""
+        with stats.measure("walk") as figures:
+            if source is None and revision is not None:
+                source = GitTreeSource(repo_path, revision)
+            walk = self.file_processor.walk(repo_path, source)
+            figures["files"] = len(walk.files)
+        return walk
+
+    def _walk_changes(
+        self, repo_path: Path, source: GitTreeSource, changed: set[str]
+    ) -> RepositoryWalk:
+        """Walk the changed files of a commit, as a full walk would.
+
+        The .gitignore files of their directories are walked along for
+        their rules, and left out of the result.
+        """
+        paths = changed.intersection(source.entries)
+        gitignores = {
+            f"{parent}/.gitignore" if parent else ".gitignore"
+            for path in paths
+            for parent in _parents(path)
+        }.intersection(source.entries).difference(paths)
+        walk = self.file_processor.walk(
+            repo_path, source, sorted(paths | gitignores, key=_walk_order)
+        )
+        walk.files = [
+            file_path
+            for file_path in walk.files
+            if file_path.relative_to(repo_path).as_posix() not in gitignores
+        ]
+        for path in gitignores:
+            walk.skipped.pop(path, None)
+        return walk
+
+    def _finish(
+        self, context: RepositoryContext, stats: IngestionStats
+    ) -> None:
+        """Summarize the context and record the ingestion statistics."""
+        with stats.measure("metadata") as figures:
+            self._update_summary(context)
+            figures["files"] = len(context.files)
+        context.ingestion_stats = stats.to_models()
+        _logger.info(
+            "Ingestion statistics",
+            stages={
+                stage: stage_stats.model_dump()
+                for stage, stage_stats in context.ingestion_stats.items()
+            },
+        )
+
+    def _update_summary(self, context: RepositoryContext) -> None:
+        """Derive metadata, languages and dependencies from context files."""
+        file_contexts = context.files
         metadata = self.metadata_extractor.extract_metadata(file_contexts)
         language_counts = self.file_processor.count_languages(file_contexts)
         dependencies = self.file_processor.extract_dependencies(file_contexts)
         language_names = list(
             {file.language for file in file_contexts if file.language}
         )
-        quickstart = self.quickstart_generator.generate(
-            language_counts, metadata
-        )
         dependencies_and_tools = (
             [tool for tool_group in metadata.values() for tool in tool_group]
             + language_names
             + dependencies
         )
-        docs_paths = self.file_processor.find_docs_files(repo_path)
 
-        return RepositoryContext(
-            files=file_contexts,
-            dependencies=dependencies_and_tools,
-            languages=language_names,
-            language_counts=language_counts,
-            metadata=metadata,
-            quickstart=quickstart,
-            docs_paths=docs_paths,
+        context.dependencies = dependencies_and_tools
+        context.languages = language_names
+        context.language_counts = language_counts
+        context.metadata = metadata
+        context.quickstart = self.quickstart_generator.generate(
+            language_counts, metadata
         )
+
+    def _resolve_commit(self, repo_path: Path) -> str | None:
+        """Return the HEAD commit SHA if the path is a git work tree."""
+        if not (repo_path / ".git").exists():
+            return None
+        try:
+            return git.Repo(repo_path).head.commit.hexsha
+        except (git.GitError, ValueError):
+            return None
+
+
+def _parse_name_status(diff: str) -> tuple[set[str], set[str]]:
+    """Split `git diff --name-status -z` output into removed and changed."""
+    removed: set[str] = set()
+    changed: set[str] = set()
+    fields = iter(diff.split("\0"))
+
+    for status in fields:
+        if not status:
+            continue
+        if status[0] in "RC":
+            source, target = next(fields), next(fields)
+            if status[0] == "R":
+                removed.add(source)
+            changed.add(target)
+        elif status[0] == "D":
+            removed.add(next(fields))
+        else:
+            changed.add(next(fields))
+
+    return removed, changed
+
+
+def _collapse_duplicates(files: list[FileContext]) -> list[FileContext]:
+    """Collapse byte-identical files with the same name, as a walk does.
+
+    Each group is kept as one context at the first of its paths in walk
+    order, listing all the others as aliases.
+    """
+    groups: dict[tuple[str, str], list[FileContext]] = {}
+    collapsed = []
+    for file in files:
+        if file.digest is None:
+            collapsed.append(file)
+        else:
+            groups.setdefault((file.digest, file.name), []).append(file)
+
+    for group in groups.values():
+        path, *aliases = sorted(
+            (path for file in group for path in (file.path, *file.aliases)),
+            key=_walk_order,
+        )
+        file = group[0]
+        if (file.path, file.aliases) != (path, aliases):
+            file = file.model_copy(update={"path": path, "aliases": aliases})
+        collapsed.append(file)
+    return sorted(collapsed, key=lambda file: _walk_order(file.path))
+
+
+def _parents(relative_path: str) -> list[str]:
+    """The directories containing a path, from the repository root down."""
+    parts = relative_path.split("/")[:-1]
+    return [""] + ["/".join(parts[: index + 1]) for index in range(len(parts))]
+
+
+def _walk_order(relative_path: str) -> tuple[list[str], str]:
+    """Sort key reproducing the order in which the walker reports paths."""
+    *parents, name = relative_path.split("/")
+    return parents, name
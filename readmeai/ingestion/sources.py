@@ -0,0 +1,96 @@
+"""Ingestion sources reading a repository snapshot without a work tree."""
+
+import copy
+import io
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from typing import Any, BinaryIO
+
+
+class FileSource(ABC):
+    """
+    Files of a repository snapshot, read by relative path.
+
+    `entries` maps the relative path of every regular file to an entry
+    with its `size` in bytes, None when it is only known by reading it.
+    Walks list these paths instead of directories, so ignored paths are
+    pruned before any file is read.
+    """
+
+    commit: str | None = None
+    entries: dict[str, Any]
+
+    @abstractmethod
+    def read(self, relative_path: str) -> bytes:
+        """Read the content of a file."""
+        ...
+
+    def size(self, relative_path: str) -> int:
+        """Return the size of a file in bytes, without reading it."""
+        return self.entries[relative_path].size
+
+    def read_text(self, relative_path: str) -> str:
+        """Read a file as UTF-8 text, for manifests and .gitignore files."""
+        return self.read(relative_path).decode("utf-8")
+
+    def read_gitignore(self, prefix: str) -> str | None:
+        """Return the .gitignore text of a directory, if readable."""
+        try:
+            return self.read_text(f"{prefix}.gitignore")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def prefetch(self, relative_paths: list[str]) -> None:
+        """Make the given files ready to read, ahead of reading them."""
+
+    def restrict(self, relative_paths: list[str]) -> "FileSource":
+        """Return a copy listing only the given files, to ship to workers."""
+        source = copy.copy(self)
+        source.entries = {path: self.entries[path] for path in relative_paths}
+        return source
+
+    @contextmanager
+    def stream(self, relative_path: str) -> Iterator[BinaryIO]:
+        """Yield a binary stream over the content of a file."""
+        yield io.BytesIO(self.read(relative_path))
+
+    def open(self, relative_path: str) -> "SourceFile":
+        """Open a file for reading, streaming its content from first read."""
+        return SourceFile(self, relative_path)
+
+    def close(self) -> None:
+        """Release the resources held to read files."""
+
+
+class SourceFile:
+    """
+    Read-only binary file over a file of a FileSource.
+    """
+
+    def __init__(self, source: FileSource, relative_path: str) -> None:
+        self.source = source
+        self.relative_path = relative_path
+        self.size = source.size(relative_path)
+        self._stream: BinaryIO | None = None
+        self._exit_stack = ExitStack()
+
+    def __enter__(self) -> "SourceFile":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stream = None
+        self._exit_stack.close()
+
+    def read(self, size: int = -1) -> bytes:
+        return self._load().read(size)
+
+    def readline(self, size: int = -1) -> bytes:
+        return self._load().readline(size)
+
+    def _load(self) -> BinaryIO:
+        if self._stream is None:
+            self._stream = self._exit_stack.enter_context(
+                self.source.stream(self.relative_path)
+            )
+        return self._stream
@@ -0,0 +1,98 @@
+"""Per-stage timing and volume figures collected during ingestion."""
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from readmeai.ingestion.models import StageStats
+
+STAGES = ("walk", "read", "clean", "parse", "metadata")
+
+
+class IngestionStats:
+    """
+    Thread-safe accumulator of wall time, CPU time, files and bytes per
+    stage. CPU time is measured per thread, so figures from concurrent
+    workers add up. Instances can be pickled to and from worker processes
+    and merged afterwards.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # Per stage: [wall time, cpu time, files, bytes read, bytes cleaned]
+        self._stages: dict[str, list[Any]] = {
+            stage: [0.0, 0.0, 0, 0, 0] for stage in STAGES
+        }
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Drop the lock when shipping stats between processes."""
+        return {"_stages": self._stages}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Recreate the lock after unpickling."""
+        self._lock = threading.Lock()
+        self._stages = state["_stages"]
+
+    def add(
+        self,
+        stage: str,
+        wall_time: float,
+        cpu_time: float,
+        files: int = 1,
+        bytes_read: int = 0,
+        bytes_cleaned: int = 0,
+    ) -> None:
+        """Add figures to a stage."""
+        with self._lock:
+            totals = self._stages.setdefault(stage, [0.0, 0.0, 0, 0, 0])
+            totals[0] += wall_time
+            totals[1] += cpu_time
+            totals[2] += files
+            totals[3] += bytes_read
+            totals[4] += bytes_cleaned
+
+    def merge(self, other: "IngestionStats") -> None:
+        """Add all figures of another collector, e.g. from a worker."""
+        for stage, totals in other._stages.items():
+            self.add(stage, *totals)
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[dict[str, int]]:
+        """Time a block and add it to a stage.
+
+        The block can set `files`, `bytes_read` and `bytes_cleaned` on the
+        dict it receives.
+        """
+        figures: dict[str, int] = {}
+        wall_start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            yield figures
+        finally:
+            self.add(
+                stage,
+                time.perf_counter() - wall_start,
+                time.thread_time() - cpu_start,
+                **{"files": 0, **figures},
+            )
+
+    def to_models(self) -> dict[str, StageStats]:
+        """Return the figures as StageStats models, keyed by stage."""
+        with self._lock:
+            return {
+                stage: StageStats(
+                    wall_time=round(wall_time, 6),
+                    cpu_time=round(cpu_time, 6),
+                    files=files,
+                    bytes_read=bytes_read,
+                    bytes_cleaned=bytes_cleaned,
+                )
+                for stage, (
+                    wall_time,
+                    cpu_time,
+                    files,
+                    bytes_read,
+                    bytes_cleaned,
+                ) in self._stages.items()
+            }
@@ -0,0 +1,214 @@
+"""Single-pass repository walker that prunes ignored directories."""
+
+import os
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import ClassVar
+
+from readmeai.ingestion.sources import FileSource
+from readmeai.preprocessor.file_filter import IgnoreMatcher, file_extension
+
+# A directory entry as (name, is directory, is regular file).
+DirectoryEntry = tuple[str, bool, bool]
+
+
+@dataclass
+class RepositoryWalk:
+    """
+    Result of walking a repository: files to ingest, docs and skipped paths.
+    """
+
+    files: list[Path] = field(default_factory=list)
+    docs: list[str] = field(default_factory=list)
+    skipped: dict[str, str] = field(default_factory=dict)
+    skipped_bytes: int = 0
+    source: FileSource | None = None
+
+
+class RepositoryWalker:
+    """
+    Walks a repository or snapshot once, classifying every entry.
+    """
+
+    hidden_kept: ClassVar[frozenset[str]] = frozenset(
+        {".github", ".gitignore"}
+    )
+
+    def __init__(
+        self,
+        ignore_list: dict,
+        docs_list: dict,
+        respect_gitignore: bool = True,
+    ) -> None:
+        self.matcher = IgnoreMatcher(ignore_list, respect_gitignore)
+        self.docs_dirs = frozenset(docs_list.get("directories", []))
+        self.docs_exts = frozenset(docs_list.get("extensions", []))
+        self.docs_files = frozenset(docs_list.get("files", []))
+
+    def walk(self, repo_path: Path) -> RepositoryWalk:
+        """Walk the repository and sort entries into files, docs and skips."""
+        root = str(repo_path)
+
+        def list_directory(prefix: str) -> list[DirectoryEntry]:
+            with os.scandir(os.path.join(root, prefix)) as it:
+                return sorted(
+                    (
+                        entry.name,
+                        entry.is_dir(follow_symlinks=False),
+                        entry.is_file(),
+                    )
+                    for entry in it
+                )
+
+        def read_gitignore(prefix: str) -> str | None:
+            try:
+                with open(
+                    os.path.join(root, prefix, ".gitignore"), encoding="utf-8"
+                ) as file:
+                    return file.read()
+            except (OSError, UnicodeDecodeError):
+                return None
+
+        return self._walk(repo_path, list_directory, read_gitignore)
+
+    def walk_tree(
+        self,
+        repo_path: Path,
+        file_paths: Iterable[str],
+        read_gitignore: Callable[[str], str | None],
+    ) -> RepositoryWalk:
+        """Walk the file paths of a snapshot as if they were on disk."""
+        directories: dict[str, dict[str, bool]] = {"": {}}
+        for file_path in file_paths:
+            *parents, name = file_path.split("/")
+            prefix = ""
+            for parent in parents:
+                directories[prefix][parent] = True
+                prefix += parent + "/"
+                directories.setdefault(prefix, {})
+            directories[prefix][name] = False
+
+        def list_directory(prefix: str) -> list[DirectoryEntry]:
+            return sorted(
+                (name, is_dir, not is_dir)
+                for name, is_dir in directories[prefix].items()
+            )
+
+        return self._walk(repo_path, list_directory, read_gitignore)
+
+    def is_excluded(self, relative_path: str) -> bool:
+        """Check whether a file is ignored by name, before any walk."""
+        *parents, name = relative_path.split("/")
+        return self.matcher.is_ignored(
+            name, relative_path, is_dir=False
+        ) or any(
+            self.matcher.is_ignored(parent, parent, is_dir=True)
+            for parent in parents
+        )
+
+    def _walk(
+        self,
+        repo_path: Path,
+        list_directory: Callable[[str], list[DirectoryEntry]],
+        read_gitignore: Callable[[str], str | None],
+    ) -> RepositoryWalk:
+        """Walk directory listings depth-first, in sorted order."""
+        result = RepositoryWalk()
+        root = os.path.join(str(repo_path), "")
+        # Each entry: (relative prefix, in docs dir, docs only, matcher
+        # with the .gitignore rules of its ancestors)
+        stack = [("", False, False, self.matcher)]
+
+        while stack:
+            prefix, in_docs, docs_only, matcher = stack.pop()
+            try:
+                entries = list_directory(prefix)
+            except OSError as exc:
+                result.skipped[prefix.rstrip("/") or "."] = (
+                    f"unreadable: {exc}"
+                )
+                continue
+            if matcher.respect_gitignore and any(
+                name == ".gitignore" and not is_dir
+                for name, is_dir, _ in entries
+            ):
+                text = read_gitignore(prefix)
+                if text is not None:
+                    matcher = matcher.with_gitignore_lines(
+                        prefix, text.splitlines()
+                    )
+
+            subdirs = []
+            for name, is_dir, is_file in entries:
+                if self._is_hidden(name, prefix):
+                    continue
+                relative = prefix + name
+                if is_dir:
+                    if state := self._enter_directory(
+                        name, relative, in_docs, docs_only, matcher, result
+                    ):
+                        subdirs.append((relative, *state))
+                elif self._visit_file(
+                    name, relative, in_docs, docs_only, matcher, result
+                ) and is_file:
+                    result.files.append(Path(root + relative))
+
+            # Reverse so that directories are visited in sorted order.
+            for relative, is_docs, only_docs in reversed(subdirs):
+                stack.append((relative + "/", is_docs, only_docs, matcher))
+
+        return result
+
+    def _enter_directory(
+        self,
+        name: str,
+        relative: str,
+        in_docs: bool,
+        docs_only: bool,
+        matcher: IgnoreMatcher,
+        result: RepositoryWalk,
+    ) -> tuple[bool, bool] | None:
+        """Return a directory's (in docs, docs only) state, None if pruned."""
+        is_docs = in_docs or name in self.docs_dirs
+        if is_docs or self._is_docs_name(name, file_extension(name)):
+            result.docs.append(relative)
+        if docs_only or matcher.is_ignored(name, relative, is_dir=True):
+            if not is_docs:
+                result.skipped[relative] = "ignored directory"
+                return None
+            return True, True
+        return is_docs, False
+
+    def _visit_file(
+        self,
+        name: str,
+        relative: str,
+        in_docs: bool,
+        docs_only: bool,
+        matcher: IgnoreMatcher,
+        result: RepositoryWalk,
+    ) -> bool:
+        """Classify a file, returning whether it should be ingested."""
+        ext = file_extension(name)
+        if in_docs or self._is_docs_name(name, ext):
+            result.docs.append(relative)
+        if docs_only:
+            return False
+        if matcher.is_ignored(name, relative, is_dir=False):
+            result.skipped[relative] = "ignored file"
+            return False
+        return True
+
+    def _is_hidden(self, name: str, prefix: str) -> bool:
+        """Check whether an entry is left out as if it had been removed."""
+        return name == ".git" or (
+            not prefix
+            and name.startswith(".")
+            and name not in self.hidden_kept
+        )
+
+    def _is_docs_name(self, name: str, ext: str) -> bool:
+        """Check whether a file or directory name marks a docs path."""
+        return ext in self.docs_exts or name in self.docs_files
+
@@ -0,0 +1,177 @@
+"""Detection of the workspace packages declared by monorepo manifests."""
+
+import json
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+
+from readmeai.logger import get_logger
+from readmeai.utils.helpers import is_available
+
+if is_available("tomllib"):  # pragma: no cover
+    import tomllib
+elif is_available("tomli"):  # pragma: no cover
+    import tomli as tomllib
+
+_logger = get_logger(__name__)
+
+MemberPatterns = tuple[list[str], list[str]]
+MemberReader = Callable[[str], MemberPatterns]
+WorkspaceTool = tuple[tuple[str, ...], tuple[str, ...], MemberReader]
+
+_GRADLE_INCLUDE = re.compile(
+    r"\binclude\s*\(?((?:\s*['\"][^'\"]+['\"]\s*,?)+)", re.DOTALL
+)
+_GRADLE_PROJECT = re.compile(r"['\"]([^'\"]+)['\"]")
+_GO_USE = re.compile(r"^\s*use\s*(?:\(([^)]*)\)|(\S+))", re.MULTILINE)
+_GO_COMMENT = re.compile(r"//.*$", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class WorkspacePackage:
+    """
+    A workspace member, by its directory relative to the repository root.
+    """
+
+    name: str
+    path: str
+    tool: str
+
+
+def find_workspace_packages(
+    repo_path: Path,
+    file_paths: Iterable[str],
+    read_text: Callable[[str], str] | None = None,
+) -> list[WorkspacePackage]:
+    """Find the members of the workspaces declared at the repository root.
+
+    Members are matched against the manifests among `file_paths`, the
+    paths already ingested, so ignored directories never become packages.
+    Root manifests are read with `read_text`, from the work tree by
+    default.
+    """
+    read_text = read_text or partial(_read_root_file, repo_path)
+    manifest_dirs: dict[str, set[str]] = {}
+    for file_path in file_paths:
+        directory, _, name = file_path.rpartition("/")
+        if directory:
+            manifest_dirs.setdefault(name, set()).add(directory)
+
+    packages: dict[str, WorkspacePackage] = {}
+    for tool, (root_names, member_names, read_members) in _WORKSPACES.items():
+        for root_name in root_names:
+            try:
+                include, exclude = read_members(read_text(root_name))
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError) as exc:
+                _logger.warning(
+                    f"Error reading workspace members from {root_name}: {exc}"
+                )
+                continue
+            if not include:
+                continue
+
+            included = _compile_globs(include)
+            excluded = _compile_globs(exclude)
+            candidates = set().union(
+                *(manifest_dirs.get(name, ()) for name in member_names)
+            )
+            for directory in candidates:
+                if included.fullmatch(directory) and not (
+                    exclude and excluded.fullmatch(directory)
+                ):
+                    packages.setdefault(
+                        directory,
+                        WorkspacePackage(
+                            directory.rsplit("/", 1)[-1], directory, tool
+                        ),
+                    )
+
+    return sorted(packages.values(), key=lambda package: package.path)
+
+
+def _read_root_file(repo_path: Path, name: str) -> str:
+    """Read a file at the repository root as UTF-8 text."""
+    path = repo_path / name
+    if not path.is_file():
+        raise FileNotFoundError(name)
+    return path.read_text(encoding="utf-8")
+
+
+def _read_npm_members(content: str) -> MemberPatterns:
+    """Read `workspaces` from a package.json, as npm and yarn define it."""
+    data = json.loads(content)
+    workspaces = data.get("workspaces", []) if isinstance(data, dict) else []
+    if isinstance(workspaces, dict):
+        workspaces = workspaces.get("packages", [])
+    include = [glob for glob in workspaces if not glob.startswith("!")]
+    exclude = [glob[1:] for glob in workspaces if glob.startswith("!")]
+    return include, exclude
+
+
+def _read_cargo_members(content: str) -> MemberPatterns:
+    """Read `members` and `exclude` from a Cargo `[workspace]` table."""
+    workspace = tomllib.loads(content).get("workspace", {})
+    return workspace.get("members", []), workspace.get("exclude", [])
+
+
+def _read_gradle_members(content: str) -> MemberPatterns:
+    """Read the projects passed to `include` in a Gradle settings file."""
+    include = [
+        project.strip(":").replace(":", "/")
+        for statement in _GRADLE_INCLUDE.finditer(content)
+        for project in _GRADLE_PROJECT.findall(statement.group(1))
+    ]
+    return include, []
+
+
+def _read_go_members(content: str) -> MemberPatterns:
+    """Read the module directories listed by `use` in a go.work file."""
+    content = _GO_COMMENT.sub("", content)
+    include = [
+        directory
+        for block, single in _GO_USE.findall(content)
+        for directory in (block.split() if block else [single])
+    ]
+    return include, []
+
+
+# Workspace tool: root manifests declaring members, member manifests and
+# the reader of the member patterns.
+_WORKSPACES: dict[str, WorkspaceTool] = {
+    "npm": (("package.json",), ("package.json",), _read_npm_members),
+    "cargo": (("Cargo.toml",), ("Cargo.toml",), _read_cargo_members),
+    "gradle": (
+        ("settings.gradle", "settings.gradle.kts"),
+        ("build.gradle", "build.gradle.kts"),
+        _read_gradle_members,
+    ),
+    "go": (("go.work",), ("go.mod",), _read_go_members),
+}
+
+
+def _compile_globs(globs: list[str]) -> re.Pattern:
+    """Compile member globs into one regex matching package directories.
+
+    `*` and `?` stay within a path segment, `**` spans segments.
+    """
+    patterns = []
+    for glob in globs:
+        glob = glob.strip()
+        while glob.startswith("./"):
+            glob = glob[2:]
+        parts = []
+        for token in re.split(r"(\*\*|\*|\?)", glob.rstrip("/")):
+            if token == "**":
+                parts.append(".*")
+            elif token == "*":
+                parts.append("[^/]*")
+            elif token == "?":
+                parts.append("[^/]")
+            else:
+                parts.append(re.escape(token))
+        patterns.append("".join(parts))
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
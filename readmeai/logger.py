@@ -94,11 +94,16 @@ class Logger:
         method_name: str,
         event_dict: MutableMapping[str, Any],
     ) -> MutableMapping[str, Any]:
-        """Extracts the message from the event dictionary and format it."""
+        """Extracts the message from the event dictionary and format it.
+
+        Key-value pairs bound to the event are kept alongside the message.
+        """
         event = event_dict.get("event", "")
         try:
             event_data = json.loads(event)
             event_dict["event"] = event_data.get("event", event)
+            for key, value in event_data.items():
+                event_dict.setdefault(key, value)
         except json.JSONDecodeError:
             ...
         return event_dict
@@ -1,4 +1,7 @@
+import copy
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Optional, Union
 
 from readmeai.config.constants import ImageOptions
@@ -8,85 +11,235 @@ from readmeai.config.settings import ConfigLoader
 from readmeai.readmegen_article.generators.builder import ArticleMarkdownBuilder
 from readmeai.generators.builder import MarkdownBuilder
 from readmeai.ingestion.models import RepositoryContext
-from readmeai.ingestion.pipeline import RepositoryProcessor
+from readmeai.ingestion.pipeline import RepositoryProcessor, RepositoryStream
+from readmeai.ingestion.sources import FileSource
+from readmeai.ingestion.workspaces import WorkspacePackage
 from readmeai.logger import get_logger
+from readmeai.models.base import BaseModelHandler
 from readmeai.models.factory import ModelFactory
 from readmeai.postprocessor import response_cleaner
+from readmeai.readers.git.metadata import (
+    MetadataCache,
+    configure_metadata_cache,
+)
+from readmeai.readers.git.mirror import MirrorCache
 from readmeai.readers.git.repository import load_data
+from readmeai.readers.git.sparse import sparse_checkout_patterns
 from readmeai.utils.file_handler import FileHandler
+from readmeai.utils.http_client import HttpClient, configure_http_client
+from readmeai.utils.url_probe import UrlProber, configure_url_prober
 
 _logger = get_logger(__name__)
 
 
 def readme_generator(
-        config: Union[ConfigLoader, ArticleConfigLoader], 
+        config: Union[ConfigLoader, ArticleConfigLoader],
         output_file: str, article: Optional[str]
 ) -> None:
     """Processes the repository and builds the README file."""
 
     with tempfile.TemporaryDirectory() as temp_dir:
 
-        repo_path = load_data(config.config.git.repository, temp_dir)
-
-        processor: RepositoryProcessor = RepositoryProcessor(config=config)
-        context: RepositoryContext = processor.process_repository(
-            repo_path=repo_path
+        sparse_patterns = (
+            sparse_checkout_patterns(
+                config.ignore_list.get("ignore_list", {}),
+                config.docs_list.get("docs_list", {}),
+            )
+            if config.config.git.sparse_clone
+            else None
         )
-
-        log_repository_context(context)
-
-        llm = ModelFactory.get_backend(config, context)
-
-        if article is None:
-            responses = llm.batch_request()
-
-            (
-                file_summaries,
-                core_features,
-                overview,
-            ) = responses
-
-            config.config.md.overview = config.config.md.overview.format(
-                response_cleaner.process_markdown(overview)
+        cache = config.config.cache
+        mirrors = (
+            MirrorCache(cache.directory, cache.mirrors_max_bytes)
+            if cache.directory is not None and cache.mirror_repositories
+            else None
+        )
+        http = config.config.http
+        configure_http_client(
+            HttpClient(
+                http.connect_timeout,
+                http.read_timeout,
+                http.retries,
+                http.max_per_host,
             )
-            config.config.md.core_features = config.config.md.core_features.format(
-                response_cleaner.process_markdown(core_features)
+        )
+        configure_metadata_cache(
+            MetadataCache(
+                cache.directory, cache.metadata_ttl, cache.metadata_max_bytes
             )
-
+        )
+        configure_url_prober(
+            UrlProber(
+                cache.directory,
+                cache.url_probes_ttl,
+                cache.url_probes_max_bytes,
+                http.probe_deadline,
+            )
+        )
+        processor: RepositoryProcessor = RepositoryProcessor(config=config)
+        source: Optional[FileSource] = None
+        revision: Optional[str] = None
+        if config.config.git.archive:
+            # Archive members are read in memory, nothing is written.
+            source = processor.file_processor.load_archive(
+                config.config.git.archive
+            )
+            repo_path = temp_dir
         else:
-            responses = llm.article_batch_request(article)
-
-            (
-                file_summary,
-                pdf_summary,
-                overview,
-                content,
-                algorithms,
-            ) = responses
-
-            config.config.md.overview = config.config.md.overview.format(
-                response_cleaner.process_markdown(overview)
+            repo_path = load_data(
+                config.config.git.repository,
+                temp_dir,
+                sparse_patterns,
+                mirrors,
+                copy_local=config.config.git.copy_local,
+                checkout=config.config.git.checkout,
+                revision=config.config.git.revision,
+                max_file_size=config.config.ingestion.max_file_size,
             )
-            config.config.md.content = config.config.md.content.format(
-                response_cleaner.process_markdown(content)
+            # Without a checkout, files are read from the git objects.
+            if not config.config.git.checkout:
+                revision = config.config.git.revision
+
+        stream: Optional[RepositoryStream] = None
+        if config.config.ingestion.workspaces:
+            context, packages = processor.process_workspace(
+                repo_path, revision, source
             )
-            config.config.md.algorithms = config.config.md.algorithms.format(
-                response_cleaner.process_markdown(algorithms)
+            log_repository_context(context)
+            if packages:
+                workspace_readme_generator(
+                    config, context, packages, output_file, article, temp_dir
+                )
+                return
+            _logger.warning(
+                "No workspace packages found, generating a single README."
             )
-
-        if config.config.md.image in [None, "", ImageOptions.ITMO_LOGO.value]:
-            config.config.md.image = ImageOptions.ITMO_LOGO.value
-
-        if article is None:
-            readme_md_content = MarkdownBuilder(config, context, temp_dir).build()
+        elif config.config.ingestion.streaming:
+            stream = processor.stream_repository(
+                repo_path=repo_path, revision=revision, source=source
+            )
+            context: RepositoryContext = stream.context
         else:
-            readme_md_content = ArticleMarkdownBuilder(config).build()
+            context = processor.process_repository(
+                repo_path=repo_path, revision=revision, source=source
+            )
+            log_repository_context(context)
+
+        llm = ModelFactory.get_backend(config, context)
+        readme_md_content = build_readme(
+            config, llm, context, temp_dir, article, stream
+        )
 
         FileHandler().write(output_file, readme_md_content)
 
         log_process_completion(output_file)
 
 
+def workspace_readme_generator(
+        config: Union[ConfigLoader, ArticleConfigLoader],
+        context: RepositoryContext,
+        packages: dict[WorkspacePackage, RepositoryContext],
+        output_file: str,
+        article: Optional[str],
+        temp_dir: str,
+) -> None:
+    """Builds a README file for every workspace package concurrently.
+
+    Each package is written next to the output file, under the package
+    directory. Packages get their own copy of the configuration, as
+    building a README fills in its markdown sections, and share one LLM
+    API client.
+    """
+    llm = ModelFactory.get_backend(config, context)
+    output_path = Path(output_file)
+
+    def generate(
+        package: WorkspacePackage, package_context: RepositoryContext
+    ) -> None:
+        package_config = copy.deepcopy(config)
+        package_config.config.git.name = package.name
+        readme_md_content = build_readme(
+            package_config,
+            llm.with_context(package_config, package_context),
+            package_context,
+            temp_dir,
+            article,
+        )
+
+        package_output = output_path.parent / package.path / output_path.name
+        package_output.parent.mkdir(parents=True, exist_ok=True)
+        FileHandler().write(package_output, readme_md_content)
+        log_process_completion(str(package_output))
+
+    with ThreadPoolExecutor(
+        max_workers=config.config.ingestion.workspace_workers
+    ) as executor:
+        futures = [
+            executor.submit(generate, package, package_context)
+            for package, package_context in packages.items()
+        ]
+        for future in futures:
+            future.result()
+
+
+def build_readme(
+        config: Union[ConfigLoader, ArticleConfigLoader],
+        llm: BaseModelHandler,
+        context: RepositoryContext,
+        temp_dir: str,
+        article: Optional[str],
+        stream: Optional[RepositoryStream] = None,
+) -> str:
+    """Requests the LLM sections and builds the README markdown content."""
+    if article is None:
+        responses = llm.batch_request(stream)
+
+        (
+            file_summaries,
+            core_features,
+            overview,
+        ) = responses
+
+        config.config.md.overview = config.config.md.overview.format(
+            response_cleaner.process_markdown(overview)
+        )
+        config.config.md.core_features = config.config.md.core_features.format(
+            response_cleaner.process_markdown(core_features)
+        )
+
+    else:
+        responses = llm.article_batch_request(article, stream)
+
+        (
+            file_summary,
+            pdf_summary,
+            overview,
+            content,
+            algorithms,
+        ) = responses
+
+        config.config.md.overview = config.config.md.overview.format(
+            response_cleaner.process_markdown(overview)
+        )
+        config.config.md.content = config.config.md.content.format(
+            response_cleaner.process_markdown(content)
+        )
+        config.config.md.algorithms = config.config.md.algorithms.format(
+            response_cleaner.process_markdown(algorithms)
+        )
+
+    if stream is not None:
+        context = stream.result()
+        log_repository_context(context)
+
+    if config.config.md.image in [None, "", ImageOptions.ITMO_LOGO.value]:
+        config.config.md.image = ImageOptions.ITMO_LOGO.value
+
+    if article is None:
+        return MarkdownBuilder(config, context, temp_dir).build()
+    return ArticleMarkdownBuilder(config).build()
+
+
 def log_repository_context(context: RepositoryContext) -> None:
     """Logs a snippet of the processed repository context data."""
     _logger.info(f"Total files analyzed: {len(context.files)}")
@@ -1,18 +1,20 @@
 import asyncio
+import copy
 from abc import ABC, abstractmethod
 from collections.abc import Generator
 
 from typing import Any, Optional
 
-import aiohttp
 from typing import Union
 
 from readmeai.readmegen_article.parser.article_finder import ArticleFinder
 from readmeai.readmegen_article.parser.pdf_parser import PdfParser
 from readmeai.readmegen_article.config.settings import ArticleConfigLoader
 from readmeai.config.settings import ConfigLoader
-from readmeai.ingestion.models import RepositoryContext
+from readmeai.ingestion.models import FileContext, RepositoryContext
+from readmeai.ingestion.pipeline import RepositoryStream
 from readmeai.models.prompts import (
+    get_file_entries,
     get_prompt_context,
     set_additional_contexts,
     set_summary_context,
@@ -35,7 +37,6 @@ class BaseModelHandler(ABC):
         self, config_loader: Union[ConfigLoader, ArticleConfigLoader], 
         context: RepositoryContext
     ) -> None:
-        self._session: aiohttp.ClientSession | None = None
         self.config = config_loader.config
         self.placeholder = self.config.md.placeholder
         self.prompts = config_loader.prompts
@@ -44,14 +45,33 @@ class BaseModelHandler(ABC):
         self.rate_limit_semaphore = asyncio.Semaphore(self.rate_limit)
         self.temperature = self.config.llm.temperature
         self.system_message = self.config.api.system_message
+        self.set_context(context)
+
+    def set_context(self, context: RepositoryContext) -> None:
+        """Sets the repository context the prompts are built from."""
         self.repo_context = context
         self.dependencies = context.dependencies
         self.documents = [
-            (file.path, file.content)
-            for file in context.files
-            if ".lock" not in file.name
+            file for file in context.files if ".lock" not in file.name
         ]
 
+    def with_context(
+        self,
+        config_loader: Union[ConfigLoader, ArticleConfigLoader],
+        context: RepositoryContext,
+    ) -> "BaseModelHandler":
+        """Returns a handler for another context sharing this API client.
+
+        Used for the packages of a workspace, which only differ in their
+        markdown settings and repository context.
+        """
+        handler = copy.copy(self)
+        handler.config = config_loader.config
+        handler.placeholder = handler.config.md.placeholder
+        handler.prompts = config_loader.prompts
+        handler.set_context(context)
+        return handler
+
     @abstractmethod
     def _model_settings(self) -> None:
         """Initializes LLM API settings for a given service."""
@@ -76,11 +96,20 @@ class BaseModelHandler(ABC):
         """Handles LLM API response and returns the generated text."""
         ...
 
-    def batch_request(self) -> list[tuple[str, str]]:
-        """Generates a batch of prompts and processes the responses."""
+    def batch_request(
+        self, stream: Optional[RepositoryStream] = None
+    ) -> list[tuple[str, str]]:
+        """Generates a batch of prompts and processes the responses.
+
+        With a repository stream, file summaries are requested while the
+        repository is still being ingested; the remaining prompts wait for
+        the complete context.
+        """
         summaries_prompts = set_summary_context(self.config, self.documents)
 
         summaries_responses = self._batch_prompts(summaries_prompts)
+        if stream is not None:
+            self.set_context(stream.result())
         additional_prompts = set_additional_contexts(
             self.config, self.repo_context, summaries_responses
         )
@@ -88,8 +117,15 @@ class BaseModelHandler(ABC):
 
         return summaries_responses + additional_responses
     
-    def article_batch_request(self, article: Optional[str] = None) -> list[tuple[str, str]]:
-        """Generates a batch of prompts and processes the responses."""
+    def article_batch_request(
+        self,
+        article: Optional[str] = None,
+        stream: Optional[RepositoryStream] = None,
+    ) -> list[tuple[str, str]]:
+        """Generates a batch of prompts and processes the responses.
+
+        A repository stream is handled as in `batch_request`.
+        """
         summaries_prompts = set_summary_context_article(self.config, self.documents)
         summaries_responses = self._article_batch_prompts(summaries_prompts)
 
@@ -102,6 +138,8 @@ class BaseModelHandler(ABC):
         pdf_summaries_prompts = set_pdf_summary_context_article(self.config, pdf_documents)
         pdf_summaries_responses = self._article_batch_prompts(pdf_summaries_prompts)
 
+        if stream is not None:
+            self.set_context(stream.result())
         additional_prompts = set_additional_contexts_article(
             self.config, self.repo_context, summaries_responses, pdf_summaries_responses
         )
@@ -204,10 +242,10 @@ class BaseModelHandler(ABC):
 
     def _make_request_code_summary(
         self,
-        file_context: list[tuple[str, str]],
+        file_context: dict[str, list[FileContext]],
     ) -> Any:
         """Generates code summaries for each file in the project."""
-        files = [file[0] for file in file_context["repo_files"]]
+        files = get_file_entries(file_context["repo_files"])
         prompt = self.prompts["prompts"]["file_summary"].format(
             files,
         )
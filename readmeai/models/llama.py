@@ -2,12 +2,12 @@
 
 import uuid
 from typing import Any
-import requests
 
 from readmeai.models.base import BaseModelHandler
 from readmeai.config.settings import ConfigLoader
 from readmeai.ingestion.models import RepositoryContext
 from readmeai.models.tokens import token_handler
+from readmeai.utils.http_client import get_http_client
 
 
 class LLamaHandler(BaseModelHandler):
@@ -50,5 +50,12 @@ class LLamaHandler(BaseModelHandler):
 
         parameters = self._build_payload(prompt, tokens, temperature)
 
-        response = requests.post(url=self.url, json=parameters)
+        response = get_http_client().post(
+            self.url,
+            json=parameters,
+            timeout=(
+                self.config.http.connect_timeout,
+                self.config.http.llm_read_timeout,
+            ),
+        )
         return index, response.json()["content"]
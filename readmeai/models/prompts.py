@@ -1,7 +1,7 @@
 """Utility methods to build prompts for LLM text generation."""
 
 from readmeai.config.settings import Settings
-from readmeai.ingestion.models import RepositoryContext
+from readmeai.ingestion.models import FileContext, RepositoryContext
 from readmeai.logger import get_logger
 
 _logger = get_logger(__name__)
@@ -35,6 +35,18 @@ def inject_prompt_context(template: str, context: dict) -> str:
         return ""
 
 
+def get_file_entries(repo_files: list[FileContext]) -> list[str]:
+    """Lists file paths, collapsing identical files into one entry."""
+    return [
+        (
+            f"{file.path} (identical copies: {', '.join(file.aliases)})"
+            if file.aliases
+            else file.path
+        )
+        for file in repo_files
+    ]
+
+
 def set_additional_contexts(
     config: Settings,
     repo_context: RepositoryContext,
@@ -65,7 +77,7 @@ def set_additional_contexts(
 
 
 def set_summary_context(
-    config: Settings, repo_files: list[tuple[str, str]]
+    config: Settings, repo_files: list[FileContext]
 ) -> list[dict]:
     """Generates the summary prompts to be used by the LLM API."""
     return [
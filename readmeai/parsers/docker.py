@@ -40,68 +40,95 @@ class DockerfileParser(BaseFileParser):
 class DockerComposeParser(BaseFileParser):
     """
     Parser for docker-compose.yaml files.
+
+    The parser keeps no state, so one instance can be shared between
+    threads; the helpers take the loaded compose data.
     """
 
     def __init__(self) -> None:
         """Initializes the handler with given configuration."""
         super().__init__()
-        self.compose_data: dict[str, Any] = {}
 
     def parse(self, content: str) -> list[str]:
         """Parses docker-compose YAML content and returns dependency list."""
         try:
-            self.compose_data = yaml.safe_load(content)
-            return self.get_services()
+            return self.get_services(yaml.safe_load(content))
         except yaml.YAMLError as e:
             return self.handle_parsing_error(e)
 
-    def get_services(self) -> list[str]:
+    def get_services(self, compose_data: dict[str, Any] | None) -> list[str]:
         """Get a list of all service names from the docker-compose.yaml."""
-        if self.compose_data is None:
+        if compose_data is None:
             return []
-        return list(self.compose_data.get("services", {}).keys())
+        return list(compose_data.get("services", {}).keys())
 
-    def get_service_info(self, service_name: str) -> dict[str, Any]:
+    def get_service_info(
+        self, compose_data: dict[str, Any], service_name: str
+    ) -> dict[str, Any]:
         """Get detailed information for a specific service."""
-        return self.compose_data.get("services", {}).get(service_name, {})
+        return compose_data.get("services", {}).get(service_name, {})
 
-    def get_service_environment(self, service_name: str) -> list[str]:
+    def get_service_environment(
+        self, compose_data: dict[str, Any], service_name: str
+    ) -> list[str]:
         """Get the environment variables for a specific service."""
-        service_info = self.get_service_info(service_name)
+        service_info = self.get_service_info(compose_data, service_name)
         return service_info.get("environment", [])
 
-    def get_service_ports(self, service_name: str) -> list[str]:
+    def get_service_ports(
+        self, compose_data: dict[str, Any], service_name: str
+    ) -> list[str]:
         """Get the ports for a specific service."""
-        service_info = self.get_service_info(service_name)
+        service_info = self.get_service_info(compose_data, service_name)
         return service_info.get("ports", [])
 
-    def get_service_command(self, service_name: str) -> str:
+    def get_service_command(
+        self, compose_data: dict[str, Any], service_name: str
+    ) -> str:
         """Get the command for a specific service."""
-        service_info = self.get_service_info(service_name)
+        service_info = self.get_service_info(compose_data, service_name)
         return service_info.get("command", "")
 
-    def get_service_networks(self, service_name: str) -> list[str]:
+    def get_service_networks(
+        self, compose_data: dict[str, Any], service_name: str
+    ) -> list[str]:
         """Get the networks for a specific service."""
-        service_info = self.get_service_info(service_name)
+        service_info = self.get_service_info(compose_data, service_name)
         return service_info.get("networks", [])
 
-    def get_service_image(self, service_name: str) -> str:
+    def get_service_image(
+        self, compose_data: dict[str, Any], service_name: str
+    ) -> str:
         """Get the image used by a specific service."""
-        service_info = self.get_service_info(service_name)
+        service_info = self.get_service_info(compose_data, service_name)
         return service_info.get("image", "")
 
-    def get_all_service_details(self) -> list[dict[str, dict[str, Any]]]:
+    def get_all_service_details(
+        self, compose_data: dict[str, Any]
+    ) -> list[dict[str, dict[str, Any]]]:
         """Get all metadata for all services."""
         return [
             {
                 service_name: {
-                    "image": self.get_service_image(service_name),
-                    "environment": self.get_service_environment(service_name),
-                    "ports": self.get_service_ports(service_name),
-                    "command": self.get_service_command(service_name),
-                    "networks": self.get_service_networks(service_name),
-                    "details": self.get_service_info(service_name),
+                    "image": self.get_service_image(
+                        compose_data, service_name
+                    ),
+                    "environment": self.get_service_environment(
+                        compose_data, service_name
+                    ),
+                    "ports": self.get_service_ports(
+                        compose_data, service_name
+                    ),
+                    "command": self.get_service_command(
+                        compose_data, service_name
+                    ),
+                    "networks": self.get_service_networks(
+                        compose_data, service_name
+                    ),
+                    "details": self.get_service_info(
+                        compose_data, service_name
+                    ),
                 }
-                for service_name in self.get_services()
+                for service_name in self.get_services(compose_data)
             }
         ]
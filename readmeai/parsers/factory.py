@@ -1,75 +1,120 @@
+import importlib
+import threading
 from typing import ClassVar
 
 from .base import BaseFileParser, DefaultParser
-from .cpp import CMakeParser, ConfigureAcParser, MakefileAmParser
-from .docker import DockerComposeParser, DockerfileParser
-from .go import GoModParser
-from .gradle import BuildGradleKtsParser, BuildGradleParser
-from .maven import MavenParser
-from .npm import PackageJsonParser
-from .properties import PropertiesParser
-from .python import RequirementsParser, TomlParser, YamlParser
-from .rust import CargoTomlParser
-from .swift import SwiftPackageParser
 
-ParserRegistryType = dict[str, type[BaseFileParser]]
+ParserRegistryType = dict[str, type[BaseFileParser] | str]
 
 
 class ParserFactory:
     """
     Factory for creating dependency file parser callable objects.
+
+    Parsers are registered by file name, or by suffix for keys starting
+    with a dot, and are looked up by the basename of the path. Parser
+    modules are imported on first use and each parser is created once:
+    parsers keep no state, so the instance is shared by all callers.
     """
 
-    _parsers: ClassVar[dict[str, type[BaseFileParser]]] = {
+    # Bump when parser output changes, to invalidate cached file contexts.
+    version: ClassVar[str] = "2"
+
+    # Parser classes, given as "module.ClassName" in this package until
+    # they are first needed.
+    _parsers: ClassVar[ParserRegistryType] = {
         # Python
-        "Pipfile": TomlParser,
-        "pyproject.toml": TomlParser,
-        "requirements.in": RequirementsParser,
-        "requirements.txt": RequirementsParser,
-        "requirements-dev.txt": RequirementsParser,
-        "requirements-test.txt": RequirementsParser,
-        "requirements-prod.txt": RequirementsParser,
-        "dev-requirements.txt": RequirementsParser,
-        "environment.yml": YamlParser,
-        "environment.yaml": YamlParser,
+        "Pipfile": "python.TomlParser",
+        "pyproject.toml": "python.TomlParser",
+        "requirements.in": "python.RequirementsParser",
+        "requirements.txt": "python.RequirementsParser",
+        "requirements-dev.txt": "python.RequirementsParser",
+        "requirements-test.txt": "python.RequirementsParser",
+        "requirements-prod.txt": "python.RequirementsParser",
+        "dev-requirements.txt": "python.RequirementsParser",
+        "environment.yml": "python.YamlParser",
+        "environment.yaml": "python.YamlParser",
         "poetry.lock": DefaultParser,
         "pdm.lock": DefaultParser,
         # C/C++
-        "CMakeLists.txt": CMakeParser,
-        "configure.ac": ConfigureAcParser,
-        "Makefile.am": MakefileAmParser,
+        "CMakeLists.txt": "cpp.CMakeParser",
+        "configure.ac": "cpp.ConfigureAcParser",
+        "Makefile.am": "cpp.MakefileAmParser",
         # JavaScript/Node.js
-        "package.json": PackageJsonParser,
+        "package.json": "npm.PackageJsonParser",
         # Kotlin/Kotlin DSL
-        "build.gradle": BuildGradleParser,
-        "build.gradle.kts": BuildGradleKtsParser,
+        "build.gradle": "gradle.BuildGradleParser",
+        "build.gradle.kts": "gradle.BuildGradleKtsParser",
         # Go
-        "go.mod": GoModParser,
+        "go.mod": "go.GoModParser",
         # Java
-        "pom.xml": MavenParser,
+        "pom.xml": "maven.MavenParser",
         # Rust
-        "Cargo.toml": CargoTomlParser,
+        "Cargo.toml": "rust.CargoTomlParser",
         # Swift
-        "Package.swift": SwiftPackageParser,
+        "Package.swift": "swift.SwiftPackageParser",
         # Docker
-        "Dockerfile": DockerfileParser,
-        "docker-compose.yaml": DockerComposeParser,
-        "docker-compose.yml": DockerComposeParser,
+        "Dockerfile": "docker.DockerfileParser",
+        "docker-compose.yaml": "docker.DockerComposeParser",
+        "docker-compose.yml": "docker.DockerComposeParser",
         # Properties
-        ".properties": PropertiesParser,
+        ".properties": "properties.PropertiesParser",
     }
+    _instances: ClassVar[dict[str, BaseFileParser]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _default: ClassVar[BaseFileParser | None] = None
 
     @classmethod
     def register_parser(
         cls, file_name: str, parser_class: type[BaseFileParser]
     ):
-        """Register a parser for the given file name."""
-        cls._parsers[file_name] = parser_class
+        """Register a parser for the given file name or `.suffix`."""
+        with cls._lock:
+            cls._parsers[file_name] = parser_class
+            cls._instances.pop(file_name, None)
+
+    @classmethod
+    def has_parser(cls, file_name: str) -> bool:
+        """Check whether a dedicated parser exists for the file path."""
+        return cls._dispatch_key(file_name) is not None
 
     @classmethod
     def create_parser(cls, file_name: str) -> BaseFileParser:
-        """Create a parser for the given file name."""
-        if parser_class := cls._parsers.get(file_name):
-            return parser_class()
-        else:
-            return DefaultParser()
+        """Return the shared parser for the given file path."""
+        key = cls._dispatch_key(file_name)
+        if key is None:
+            if cls._default is None:
+                cls._default = DefaultParser()
+            return cls._default
+        if parser := cls._instances.get(key):
+            return parser
+
+        with cls._lock:
+            if key not in cls._instances:
+                cls._instances[key] = _load_parser(cls._parsers[key])()
+            return cls._instances[key]
+
+    @classmethod
+    def _dispatch_key(cls, file_name: str) -> str | None:
+        """Find the registry key for a path: its basename, else a suffix.
+
+        Longer suffixes win, e.g. `.gradle.kts` over `.kts`.
+        """
+        name = file_name.rsplit("/", 1)[-1]
+        if name in cls._parsers:
+            return name
+        index = name.find(".", 1)
+        while index != -1:
+            if name[index:] in cls._parsers:
+                return name[index:]
+            index = name.find(".", index + 1)
+        return None
+
+
+def _load_parser(parser: type[BaseFileParser] | str) -> type[BaseFileParser]:
+    """Import a parser class given as "module.ClassName" in this package."""
+    if not isinstance(parser, str):
+        return parser
+    module_name, class_name = parser.rsplit(".", 1)
+    module = importlib.import_module(f"{__package__}.{module_name}")
+    return getattr(module, class_name)
@@ -1,15 +1,14 @@
 """Parser for *.properties configuration files."""
 
 import re
+from typing import ClassVar
 
 from .base import BaseFileParser
 
 
 class PropertiesParser(BaseFileParser):
-    def __init__(self):
-        super().__init__()
-        super().__init__()
-        self.common_tech_keywords = {
+    common_tech_keywords: ClassVar[frozenset[str]] = frozenset(
+        {
             "spring",
             "gradle",
             "maven",
@@ -187,6 +186,7 @@ class PropertiesParser(BaseFileParser):
             "vega",
             "kendo-ui",
         }
+    )
 
     def parse(self, content: str) -> list[str]:
         lines = content.split("\n")
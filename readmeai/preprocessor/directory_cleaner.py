@@ -14,9 +14,12 @@ def remove_directory(path: Path) -> None:
 
 
 def remove_hidden_contents(directory: Path) -> None:
-    """Remove hidden files and directories from a specified directory."""
+    """Remove hidden files and directories from a specified directory.
+
+    The .gitignore file is kept so that ingestion can honour it.
+    """
     for item in directory.iterdir():
-        if ".github" in item.parts:
+        if ".github" in item.parts or item.name == ".gitignore":
             continue
         if item.name.startswith("."):
             if item.is_dir():
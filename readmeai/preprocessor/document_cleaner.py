@@ -1,5 +1,6 @@
 import re
 import textwrap
+from typing import ClassVar
 
 
 class DocumentCleaner:
@@ -7,6 +8,9 @@ class DocumentCleaner:
     Document cleaner to preprocess repository content.
     """
 
+    # Bump when cleaning output changes, to invalidate cached file contexts.
+    version: ClassVar[str] = "1"
+
     def __init__(
         self,
         remove_empty_lines: bool = True,
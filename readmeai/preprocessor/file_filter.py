@@ -1,5 +1,9 @@
 """Filter files based on a default ignore list."""
 
+import copy
+import os
+import re
+from collections.abc import Iterable
 from pathlib import Path
 
 
@@ -29,3 +33,211 @@ def is_included(docs_list: dict, file_path: Path, repo_path: Path) -> bool:
         return True
 
     return file_path.name in docs_list.get("files", [])
+
+
+def file_extension(name: str) -> str:
+    """Return the file extension without the dot, as Path.suffix would."""
+    return os.path.splitext(name)[1].lstrip(".")
+
+
+class GitignoreRules:
+    """
+    Patterns from a single .gitignore file, compiled for fast matching.
+
+    Literal names and `*.ext` patterns are kept in sets, everything else is
+    joined into one regex. Files with negated patterns fall back to
+    evaluating each pattern in order, last match wins, as git does.
+    """
+
+    def __init__(self, base: str, lines: Iterable[str]) -> None:
+        self.base = base
+        self.rules = [
+            rule for line in lines if (rule := _parse_pattern(line))
+        ]
+        self.ordered = any(negate for _, negate, _, _ in self.rules)
+        self.names: set[str] = set()
+        self.dir_names: set[str] = set()
+        self.extensions: set[str] = set()
+        patterns: list[str] = []
+        dir_patterns: list[str] = []
+
+        for pattern, _, dir_only, anchored in self.rules:
+            if not anchored and not _has_glob(pattern):
+                (self.dir_names if dir_only else self.names).add(pattern)
+            elif (
+                not anchored
+                and not dir_only
+                and pattern.startswith("*.")
+                and not _has_glob(pattern[2:])
+                and "." not in pattern[2:]
+            ):
+                self.extensions.add(pattern[2:])
+            else:
+                regex = _translate(pattern, anchored)
+                (dir_patterns if dir_only else patterns).append(regex)
+
+        self.pattern = _join(patterns)
+        self.dir_pattern = _join(patterns + dir_patterns)
+        self.compiled = [
+            (re.compile(_translate(pattern, anchored)), negate, dir_only)
+            for pattern, negate, dir_only, anchored in self.rules
+            if self.ordered
+        ]
+
+    def match(self, relative: str, name: str, is_dir: bool) -> bool | None:
+        """Return True if ignored, False if re-included, None if no match."""
+        path = relative[len(self.base) :]
+        if self.ordered:
+            for regex, negate, dir_only in reversed(self.compiled):
+                if (is_dir or not dir_only) and regex.fullmatch(path):
+                    return not negate
+            return None
+
+        if name in self.names or (is_dir and name in self.dir_names):
+            return True
+        _, dot, ext = name.rpartition(".")
+        if dot and ext in self.extensions:
+            return True
+        pattern = self.dir_pattern if is_dir else self.pattern
+        if pattern is not None and pattern.fullmatch(path):
+            return True
+        return None
+
+
+class IgnoreMatcher:
+    """
+    Compiled matcher for the ignore list and a repository's .gitignore files.
+
+    Ignore list entries are hashed into sets, so the common case is a
+    constant-time lookup. Matchers are extended one directory at a time
+    while walking, with the rules of deeper .gitignore files taking
+    precedence over those of their parents.
+    """
+
+    def __init__(self, ignore_list: dict, respect_gitignore: bool = True):
+        self.directories = frozenset(ignore_list.get("directories", []))
+        self.extensions = frozenset(ignore_list.get("extensions", []))
+        self.files = frozenset(ignore_list.get("files", []))
+        self.respect_gitignore = respect_gitignore
+        self.gitignores: tuple[GitignoreRules, ...] = ()
+
+    def with_gitignore(self, directory: Path, prefix: str) -> "IgnoreMatcher":
+        """Return a matcher extended with the directory's .gitignore rules.
+
+        The matcher itself is returned when there is no .gitignore file.
+        """
+        if not self.respect_gitignore:
+            return self
+        try:
+            with open(directory / ".gitignore", encoding="utf-8") as file:
+                lines = file.read().splitlines()
+        except (OSError, UnicodeDecodeError):
+            return self
+        return self.with_gitignore_lines(prefix, lines)
+
+    def with_gitignore_lines(
+        self, prefix: str, lines: Iterable[str]
+    ) -> "IgnoreMatcher":
+        """Return a matcher extended with .gitignore rules for a prefix."""
+        if not self.respect_gitignore:
+            return self
+        rules = GitignoreRules(prefix, lines)
+        if not rules.rules:
+            return self
+        matcher = copy.copy(self)
+        matcher.gitignores = (*self.gitignores, rules)
+        return matcher
+
+    def is_ignored(self, name: str, relative: str, is_dir: bool) -> bool:
+        """Check whether a file or directory should be left out."""
+        if is_dir:
+            if name in self.directories:
+                return True
+        elif name in self.files or file_extension(name) in self.extensions:
+            return True
+
+        for rules in reversed(self.gitignores):
+            matched = rules.match(relative, name, is_dir)
+            if matched is not None:
+                return matched
+        return False
+
+
+def _parse_pattern(line: str) -> tuple[str, bool, bool, bool] | None:
+    """Parse a .gitignore line into (pattern, negate, dir only, anchored)."""
+    if not line or line.startswith("#"):
+        return None
+    stripped = line.rstrip(" ")
+    if stripped.endswith("\\") and len(stripped) < len(line):
+        stripped += " "
+    line = stripped
+
+    negate = line.startswith("!")
+    if negate or line.startswith(("\\!", "\\#")):
+        line = line[1:]
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    anchored = "/" in line
+    line = line.lstrip("/")
+    if not line:
+        return None
+    return line, negate, dir_only, anchored
+
+
+def _has_glob(pattern: str) -> bool:
+    """Check whether a pattern has wildcards, classes or escapes."""
+    return any(char in pattern for char in "*?[\\")
+
+
+def _translate(pattern: str, anchored: bool) -> str:
+    """Translate a .gitignore glob into a regex for fullmatch."""
+    parts = [] if anchored else ["(?:.*/)?"]
+    i, n = 0, len(pattern)
+
+    while i < n:
+        char = pattern[i]
+        if char == "*":
+            if pattern.startswith("**", i) and (
+                i == 0 or pattern[i - 1] == "/"
+            ):
+                if i + 2 == n:
+                    parts.append(".*")
+                    i += 2
+                    continue
+                if pattern[i + 2] == "/":
+                    parts.append("(?:.*/)?")
+                    i += 3
+                    continue
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "[":
+            j = i + 1
+            if j < n and pattern[j] in "!^":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            j = pattern.find("]", j)
+            if j < 0:
+                parts.append(re.escape(char))
+            else:
+                members = pattern[i + 1 : j].replace("\\", "\\\\")
+                if members[0] in "!^":
+                    members = "^" + members[1:]
+                parts.append(f"[{members}]")
+                i = j
+        elif char == "\\" and i + 1 < n:
+            i += 1
+            parts.append(re.escape(pattern[i]))
+        else:
+            parts.append(re.escape(char))
+        i += 1
+
+    return "".join(parts)
+
+
+def _join(patterns: list[str]) -> re.Pattern | None:
+    """Combine regexes into a single alternation, if there are any."""
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
@@ -0,0 +1,87 @@
+"""Cheap classification and bounded reading of repository files."""
+
+import hashlib
+import re
+from collections import deque
+from typing import BinaryIO, NamedTuple
+
+LFS_POINTER_HEADER = b"version https://git-lfs.github.com/spec/"
+SNIFF_SIZE = 8192
+MAX_LINE_SIZE = 4096
+SAMPLE_GAP = b"...\n"
+STRUCTURAL_LINE = re.compile(
+    rb"^\s*(?:export|def|async\s+def|class|function|func|fn|pub|public|"
+    rb"interface|struct|enum|trait|impl|module|package|import|from|"
+    rb"create\s+(?:table|view|function|procedure|index))\b",
+    re.IGNORECASE,
+)
+
+
+class SkippedFile(NamedTuple):
+    """
+    A file left out of ingestion, with the reason and its size in bytes.
+    """
+
+    reason: str
+    size: int = 0
+
+
+def sniff(prefix: bytes) -> str | None:
+    """Return a skip reason for a file based on its first bytes, if any."""
+    if prefix.startswith(LFS_POINTER_HEADER):
+        return "git-lfs pointer"
+    if b"\0" in prefix:
+        return "binary"
+    return None
+
+
+def decode_text(raw: bytes) -> str:
+    """Decode file bytes like `Path.read_text(errors="ignore")` would."""
+    text = raw.decode(errors="ignore")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def read_sampled(
+    file: BinaryIO, prefix: bytes, max_bytes: int
+) -> tuple[bytes, str, bool]:
+    """Read the rest of an open file, sampling it if above max_bytes.
+
+    Small files are returned whole. Larger files are streamed line by line
+    and reduced to their head, their tail and the structural lines (defs,
+    classes, exports, ...) in between, so memory stays bounded by
+    max_bytes. Returns the content, a digest of the full file and whether
+    the content was sampled.
+    """
+    digest = hashlib.blake2b(prefix, digest_size=16)
+    chunk = file.read(max(max_bytes - len(prefix), 0) + 1)
+    digest.update(chunk)
+    content = prefix + chunk
+    if len(content) <= max_bytes:
+        return content, digest.hexdigest(), False
+
+    head_size = content.rfind(b"\n", 0, max_bytes // 2) + 1
+    head = content[:head_size]
+    tail_budget = structural_budget = max_bytes // 4
+    tail = deque(content[head_size:].splitlines(keepends=True))
+    tail_size = len(content) - head_size
+    structural: list[bytes] = []
+
+    while True:
+        while tail_size > tail_budget and len(tail) > 1:
+            line = tail.popleft()
+            tail_size -= len(line)
+            if (
+                len(line) <= structural_budget
+                and STRUCTURAL_LINE.match(line)
+            ):
+                structural.append(line)
+                structural_budget -= len(line)
+        line = file.readline(MAX_LINE_SIZE)
+        if not line:
+            break
+        digest.update(line)
+        tail.append(line)
+        tail_size += len(line)
+
+    sampled = b"".join([head, SAMPLE_GAP, *structural, SAMPLE_GAP, *tail])
+    return sampled, digest.hexdigest(), True
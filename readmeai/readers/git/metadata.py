@@ -2,13 +2,17 @@
 Retrieve metadata of a git repository via the host provider's API.
 """
 
+import threading
+import time
 from dataclasses import dataclass
-from typing import Any
+from pathlib import Path
 
 import requests
 
 from readmeai.logger import get_logger
 from readmeai.readers.git.providers import GitURL
+from readmeai.utils.disk_cache import DiskCache
+from readmeai.utils.http_client import get_http_client
 
 _logger = get_logger(__name__)
 
@@ -104,17 +108,114 @@ def _parse_repository_metadata(repo_data: dict) -> RepositoryMetadata:
 def _load_data_metadata(
     url: str,
     **kwargs,
-) -> dict[str, Any]:
+) -> requests.Response:
     """Fetches repository metadata from the git host provider."""
     try:
-        response = requests.get(url, **kwargs)
-        response.raise_for_status()
-        return response.json()
+        response = get_http_client().get(url, **kwargs)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
     except requests.RequestException as exc:
         _logger.error(f"Error while fetching repository metadata: {exc}")
         raise
 
 
+class MetadataCache:
+    """
+    Repository metadata memoized per run and, optionally, kept on disk.
+
+    Within a run, every repository is fetched at most once, even by
+    concurrent callers. On disk, responses are stored with their `ETag`
+    and `Last-Modified` headers, used as is for `ttl` seconds and then
+    revalidated with a conditional request, whose 304 answer does not
+    count against GitHub's rate limit.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        ttl: float = 3600.0,
+        max_bytes: int = 16 * 1024 * 1024,
+    ) -> None:
+        self.disk_cache = (
+            DiskCache(Path(directory) / "metadata", max_bytes)
+            if directory is not None
+            else None
+        )
+        self.ttl = ttl
+        self._results: dict[str, RepositoryMetadata | None] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def fetch(self, api_url: str) -> RepositoryMetadata | None:
+        """Return the metadata behind a host API URL, fetching it once."""
+        with self._lock:
+            lock = self._locks.setdefault(api_url, threading.Lock())
+        with lock:
+            if api_url not in self._results:
+                self._results[api_url] = self._fetch(api_url)
+            return self._results[api_url]
+
+    def _fetch(self, api_url: str) -> RepositoryMetadata | None:
+        """Fetch metadata, going through the disk cache if there is one."""
+        cached = (
+            self.disk_cache.get(api_url)
+            if self.disk_cache is not None
+            else None
+        )
+        if cached and time.time() - cached["fetched_at"] < self.ttl:
+            return _parse_repository_metadata(cached["data"])
+
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+        try:
+            response = _load_data_metadata(api_url, headers=headers)
+            not_modified = bool(cached) and response.status_code == 304
+            data = cached["data"] if not_modified else response.json()
+        except (requests.RequestException, ValueError) as exc:
+            if not cached:
+                _logger.error(
+                    f"Client error while fetching repository metadata: {exc}",
+                )
+                return None
+            _logger.warning(
+                f"Using stale repository metadata for {api_url}: {exc}"
+            )
+            return _parse_repository_metadata(cached["data"])
+
+        if self.disk_cache is not None:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if not_modified:
+                # A 304 may leave out validators that still hold.
+                etag = etag or cached.get("etag")
+                last_modified = last_modified or cached.get("last_modified")
+            self.disk_cache.set(
+                api_url,
+                {
+                    "data": data,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "fetched_at": time.time(),
+                },
+            )
+            self.disk_cache.prune()
+        return _parse_repository_metadata(data) if data else None
+
+
+# Shared by all callers of a run, without a disk cache until configured.
+_metadata_cache = MetadataCache()
+
+
+def configure_metadata_cache(cache: MetadataCache) -> None:
+    """Replace the metadata cache used by fetch_git_repository_metadata."""
+    global _metadata_cache
+    _metadata_cache = cache
+
+
 def fetch_git_repository_metadata(
     repository: str,
 ) -> RepositoryMetadata | None:
@@ -122,11 +223,4 @@ def fetch_git_repository_metadata(
     api_url = GitURL.create(repository).get_api_url()
     if not api_url:
         return None
-    try:
-        metadata = _load_data_metadata(api_url)
-        return _parse_repository_metadata(metadata) if metadata else None
-    except requests.RequestException as exc:
-        _logger.error(
-            f"Client error while fetching repository metadata: {exc}",
-        )
-        return None
+    return _metadata_cache.fetch(api_url)
@@ -0,0 +1,241 @@
+"""Bare mirrors of remote repositories, kept on disk across runs."""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import git
+
+from readmeai.logger import get_logger
+from readmeai.readers.git.providers import GitURL
+from readmeai.readers.git.sparse import sparse_checkout
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+_logger = get_logger(__name__)
+
+_BRANCHES_REFSPEC = "+refs/heads/*:refs/heads/*"
+_TAGS_REFSPEC = "+refs/tags/*:refs/tags/*"
+
+
+def mirror_key(repo_url: str) -> str:
+    """Normalize a repository URL, so that spellings of it share a mirror.
+
+    The scheme, credentials, a trailing slash and a `.git` suffix are
+    dropped and the host is lowercased.
+    """
+    url = GitURL.create(repo_url).url
+    path = url.path.strip("/").removesuffix(".git").rstrip("/")
+    return f"{url.host.lower()}/{path}"
+
+
+class MirrorCache:
+    """
+    Blobless mirrors of remote repositories, updated with `git fetch`.
+
+    Mirrors hold the branches and tags of a repository with their commits
+    and trees, but no blobs, which checkouts fetch from the repository.
+
+    Each mirror has a lock file next to it. Cloning, fetching and evicting
+    a mirror hold its lock exclusively, while reading from it holds the
+    lock shared, so concurrent jobs can use one cache directory. Lock
+    files are touched on every use and mirrors above `max_bytes` in total
+    are evicted least recently used first.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int) -> None:
+        self.directory = Path(directory) / "mirrors"
+        self.max_bytes = max_bytes
+
+    @contextmanager
+    def open(self, repo_url: str) -> Iterator[Path]:
+        """Update the mirror of a repository and yield its path.
+
+        The mirror cannot be fetched or evicted until the context exits.
+        A mirror that cannot be fetched is used as it is.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        key = mirror_key(repo_url)
+        name = hashlib.sha256(key.encode()).hexdigest()[:24]
+        mirror_path = self.directory / f"{name}.git"
+
+        lock_path = self.directory / f"{name}.lock"
+        with _FileLock(lock_path) as lock:
+            lock.acquire(exclusive=True)
+            os.utime(lock_path)
+            self._update(repo_url, mirror_path)
+            lock.acquire(exclusive=False)
+            yield mirror_path
+
+        self.prune(keep=mirror_path)
+
+    def checkout(
+        self,
+        repo_url: str,
+        target: Path,
+        sparse_patterns: list[str] | None = None,
+        bare: bool = False,
+    ) -> None:
+        """Materialize the default branch of a repository into a directory.
+
+        The directory gets a blobless clone of the mirror, with objects of
+        its own, then its remote is pointed at the repository itself. The
+        blobs to check out are fetched from there in one batch, as are
+        those read later from a bare clone, which has no work tree.
+        """
+        with self.open(repo_url) as mirror_path:
+            repo = git.Repo.clone_from(
+                mirror_path.as_uri(),
+                str(target),
+                filter="blob:none",
+                bare=bare,
+                no_checkout=True,
+            )
+        repo.remote().set_url(repo_url)
+        if bare:
+            return
+        if sparse_patterns is not None:
+            sparse_checkout(repo, sparse_patterns)
+        else:
+            repo.git.read_tree("-mu", "HEAD")
+
+    def prune(self, keep: Path | None = None) -> int:
+        """Evict least recently used mirrors above max_bytes.
+
+        Mirrors in use by other jobs are skipped. Returns the number of
+        bytes removed.
+        """
+        mirrors = []
+        total = 0
+        for mirror_path in self.directory.glob("*.git"):
+            lock_path = mirror_path.with_suffix(".lock")
+            try:
+                last_used = lock_path.stat().st_mtime
+            except OSError:
+                last_used = 0.0
+            size = _directory_size(mirror_path)
+            mirrors.append((last_used, size, mirror_path))
+            total += size
+
+        removed = 0
+        for _, size, mirror_path in sorted(mirrors):
+            if total - removed <= self.max_bytes:
+                break
+            if mirror_path == keep:
+                continue
+            with _FileLock(mirror_path.with_suffix(".lock")) as lock:
+                if not lock.acquire(exclusive=True, blocking=False):
+                    continue
+                shutil.rmtree(mirror_path, ignore_errors=True)
+            removed += size
+            _logger.info(f"Evicted repository mirror {mirror_path.name}")
+        return removed
+
+    def _update(self, repo_url: str, mirror_path: Path) -> None:
+        """Fetch into an existing mirror, or clone a new one."""
+        if mirror_path.is_dir():
+            start = time.perf_counter()
+            try:
+                git.Repo(mirror_path).git.fetch("--prune", "origin")
+            except git.GitCommandError as exc:
+                _logger.warning(
+                    f"Fetching {repo_url} failed, using its mirror as is: "
+                    f"{exc}"
+                )
+                return
+            _logger.info(
+                f"Fetched mirror of {repo_url} in "
+                f"{time.perf_counter() - start:.2f}s"
+            )
+            return
+
+        # Clone next to the final path so that an interrupted clone never
+        # leaves a partial mirror behind, and sweep those of killed jobs.
+        for partial in self.directory.glob(f"{mirror_path.stem}.*.partial"):
+            shutil.rmtree(partial, ignore_errors=True)
+        temp_path = Path(
+            tempfile.mkdtemp(
+                dir=self.directory,
+                prefix=f"{mirror_path.stem}.",
+                suffix=".partial",
+            )
+        )
+        try:
+            repo = git.Repo.clone_from(
+                repo_url, str(temp_path), bare=True, filter="blob:none"
+            )
+            # Later fetches keep to branches and tags, skipping refs such
+            # as refs/pull/* that a mirror clone would copy.
+            repo.git.config("remote.origin.fetch", _BRANCHES_REFSPEC)
+            repo.git.config("--add", "remote.origin.fetch", _TAGS_REFSPEC)
+            # Checkouts clone the mirror with the same filter.
+            repo.git.config("uploadpack.allowFilter", "true")
+            os.replace(temp_path, mirror_path)
+        finally:
+            shutil.rmtree(temp_path, ignore_errors=True)
+
+
+class _FileLock:
+    """
+    Advisory lock on a file, held by an open handle across processes.
+
+    Locks are shared or exclusive with fcntl. msvcrt has no shared locks,
+    so on Windows every lock is exclusive.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.file = open(path, "a+b")
+        self.locked = False
+
+    def __enter__(self) -> "_FileLock":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        # Closing the handle releases the lock.
+        self.file.close()
+
+    def acquire(self, exclusive: bool, blocking: bool = True) -> bool:
+        """Take or convert the lock, returning False if it is busy."""
+        if fcntl is not None:
+            operation = fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH
+            if not blocking:
+                operation |= fcntl.LOCK_NB
+            try:
+                fcntl.flock(self.file.fileno(), operation)
+            except BlockingIOError:
+                return False
+            return True
+
+        if self.locked:
+            return True
+        self.file.seek(0)
+        while True:
+            try:
+                msvcrt.locking(self.file.fileno(), msvcrt.LK_NBLCK, 1)
+                self.locked = True
+                return True
+            except OSError:
+                if not blocking:
+                    return False
+                time.sleep(0.1)
+
+
+def _directory_size(path: Path) -> int:
+    """Sum the sizes of the files below a directory."""
+    total = 0
+    for directory, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(directory, name))
+            except OSError:
+                continue
+    return total
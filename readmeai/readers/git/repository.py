@@ -10,22 +10,120 @@ from readmeai.preprocessor.directory_cleaner import (
     remove_directory,
     remove_hidden_contents,
 )
+from readmeai.readers.git.mirror import MirrorCache
+from readmeai.readers.git.sparse import sparse_checkout
 
 _logger = get_logger(__name__)
 
 
-def clone_repository(repo_url: str, target: Path, depth: int = 1) -> None:
+def clone_repository(
+    repo_url: str,
+    target: Path,
+    depth: int = 1,
+    sparse_patterns: list[str] | None = None,
+) -> None:
     """
     Clone a Git repository to the specified target directory.
 
+    With sparse checkout patterns, the clone is made without blobs and
+    only the blobs of the checked out paths are fetched. It falls back to
+    a full clone when the server or the local git do not support this.
+
     :param repo_url: URL repository.
     :param target: path where to clone.
     :param depth: cloning depth (default 1).
+    :param sparse_patterns: non-cone sparse checkout patterns.
     """
 
+    if sparse_patterns is not None:
+        try:
+            sparse_clone_repository(repo_url, target, sparse_patterns, depth)
+            return
+        except git.GitCommandError as exc:
+            _logger.warning(
+                f"Sparse clone of {repo_url} failed, cloning in full: {exc}"
+            )
+            remove_directory(target)
+
     git.Repo.clone_from(repo_url, str(target), depth=depth, single_branch=True)
 
 
+def sparse_clone_repository(
+    repo_url: str, target: Path, sparse_patterns: list[str], depth: int = 1
+) -> None:
+    """
+    Make a blobless clone and check out the paths matching the patterns.
+
+    :param repo_url: URL repository.
+    :param target: path where to clone.
+    :param sparse_patterns: non-cone sparse checkout patterns.
+    :param depth: cloning depth (default 1).
+    """
+
+    repo = git.Repo.clone_from(
+        repo_url,
+        str(target),
+        depth=depth,
+        single_branch=True,
+        no_checkout=True,
+        filter="blob:none",
+    )
+    # Missing blobs of the checked out paths are fetched in one batch.
+    sparse_checkout(repo, sparse_patterns)
+
+
+def bare_clone_repository(
+    repo_url: str,
+    target: Path,
+    revision: str = "HEAD",
+    depth: int = 1,
+    max_file_size: int | None = None,
+) -> None:
+    """
+    Make a partial bare clone of a revision, without a checkout.
+
+    Blobs above `max_file_size` are left out of the clone, and all blobs
+    without it. Ingestion fetches the missing blobs of the files it reads
+    in one batch, see `GitTreeSource.prefetch`. Branches and tags are
+    cloned shallow. Other revisions, e.g. commit SHAs, need the full
+    history to be found.
+
+    :param repo_url: URL repository.
+    :param target: path where to clone.
+    :param revision: branch, tag or commit to read files from.
+    :param depth: cloning depth (default 1).
+    :param max_file_size: size in bytes of the largest blobs to clone.
+    """
+
+    object_filter = (
+        "blob:none"
+        if max_file_size is None
+        else f"blob:limit={max_file_size}"
+    )
+    options = {} if revision == "HEAD" else {"branch": revision}
+    try:
+        git.Repo.clone_from(
+            repo_url,
+            str(target),
+            bare=True,
+            depth=depth,
+            single_branch=True,
+            filter=object_filter,
+            **options,
+        )
+    except git.GitCommandError:
+        if not options:
+            raise
+        _logger.warning(
+            f"{revision} is not a branch or tag of {repo_url}, "
+            "cloning its full history"
+        )
+        remove_directory(target)
+        git.Repo.clone_from(
+            repo_url, str(target), bare=True, filter=object_filter
+        )
+
+
 def copy_directory(source: Path, target: Path) -> None:
     """Copy a directory and its contents to a new location.
 
@@ -44,20 +142,62 @@ def copy_directory(source: Path, target: Path) -> None:
         )
 
 
-def load_data(repository: Path | str, temp_dir: str) -> str:
+def load_data(
+    repository: Path | str,
+    temp_dir: str,
+    sparse_patterns: list[str] | None = None,
+    mirrors: MirrorCache | None = None,
+    copy_local: bool = False,
+    checkout: bool = True,
+    revision: str = "HEAD",
+    max_file_size: int | None = None,
+) -> str:
+    """Return the path to ingest a repository from.
+
+    Local repositories are read in place, hidden entries being left out by
+    the walker, unless `copy_local` asks for a cleaned copy in the
+    directory. Remote repositories are cloned into it, from `mirrors` when
+    given; `sparse_patterns` only apply to clones, see `clone_repository`.
+
+    Without `checkout`, remote repositories are cloned bare, holding the
+    objects of `revision`, for ingestion to read from the object database.
+    Blobs above `max_file_size` are then never downloaded. Local
+    repositories are always read in place without a checkout.
+    """
     temp_dir_path = Path(temp_dir)
     repo_path = Path(repository)
 
+    if repo_path.is_dir() and (not copy_local or not checkout):
+        _logger.info(f"Reading local repository {repo_path} in place")
+        return str(repo_path)
+
     try:
         if temp_dir_path.exists():
             remove_directory(temp_dir_path)
 
         if repo_path.is_dir():
             copy_directory(repo_path, temp_dir_path)
+        elif mirrors is not None:
+            mirrors.checkout(
+                str(repository),
+                temp_dir_path,
+                sparse_patterns,
+                bare=not checkout,
+            )
+        elif not checkout:
+            bare_clone_repository(
+                str(repository),
+                temp_dir_path,
+                revision,
+                max_file_size=max_file_size,
+            )
         else:
-            clone_repository(str(repository), temp_dir_path)
+            clone_repository(
+                str(repository), temp_dir_path, sparse_patterns=sparse_patterns
+            )
 
-        remove_hidden_contents(temp_dir_path)
+        if checkout:
+            remove_hidden_contents(temp_dir_path)
 
         return str(temp_dir_path)
     except Exception as e:
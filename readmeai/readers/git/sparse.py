@@ -0,0 +1,69 @@
+"""Sparse checkouts leaving out the paths that ingestion ignores."""
+
+from pathlib import Path
+
+import git
+
+from readmeai.preprocessor.file_filter import file_extension
+
+
+def sparse_checkout(repo: git.Repo, sparse_patterns: list[str]) -> None:
+    """
+    Check out HEAD into a repository cloned with --no-checkout.
+
+    :param repo: repository without a checked out work tree.
+    :param sparse_patterns: non-cone sparse checkout patterns.
+    """
+
+    repo.git.config("core.sparseCheckout", "true")
+    repo.git.config("core.sparseCheckoutCone", "false")
+    sparse_file = Path(repo.git_dir) / "info" / "sparse-checkout"
+    sparse_file.parent.mkdir(parents=True, exist_ok=True)
+    sparse_file.write_text("\n".join(sparse_patterns) + "\n", encoding="utf-8")
+    repo.git.read_tree("-mu", "HEAD")
+
+
+def sparse_checkout_patterns(ignore_list: dict, docs_list: dict) -> list[str]:
+    """
+    Build sparse checkout patterns leaving out the paths ingestion ignores.
+
+    Ignored names that are docs names too are kept, as are docs
+    directories and .gitignore files, which ingestion reads. Multi-dot
+    extensions are kept since ingestion only compares the last suffix.
+
+    :param ignore_list: directories, extensions and files to ignore.
+    :param docs_list: directories, extensions and files listed as docs.
+    """
+
+    docs_dirs = docs_list.get("directories", [])
+    docs_exts = set(docs_list.get("extensions", []))
+    docs_files = set(docs_list.get("files", []))
+
+    patterns = ["/*"]
+    patterns.extend(
+        f"!{_escape_pattern(name)}/"
+        for name in ignore_list.get("directories", [])
+        if name not in docs_dirs
+    )
+    patterns.extend(
+        f"!*.{_escape_pattern(ext)}"
+        for ext in ignore_list.get("extensions", [])
+        if ext not in docs_exts and "." not in ext
+    )
+    patterns.extend(
+        f"!{_escape_pattern(name)}"
+        for name in ignore_list.get("files", [])
+        if name not in docs_files
+        and file_extension(name) not in docs_exts
+    )
+    patterns.extend(f"**/{_escape_pattern(name)}/**" for name in docs_dirs)
+    patterns.append(".gitignore")
+    return patterns
+
+
+def _escape_pattern(name: str) -> str:
+    """Escape a literal name for use in a sparse checkout pattern."""
+    escaped = "".join(
+        f"\\{char}" if char in "*?[\\" else char for char in name
+    )
+    return f"\\{escaped}" if escaped.startswith(("!", "#")) else escaped
@@ -22,7 +22,15 @@ from readmeai.logger import get_logger
 from readmeai.utils.file_handler import FileHandler
 from readmeai.utils.file_resource import get_resource_path
 
-from readmeai.config.settings import APISettings, FileSettings, GitSettings, ModelSettings
+from readmeai.config.settings import (
+    APISettings,
+    CacheSettings,
+    FileSettings,
+    GitSettings,
+    HttpSettings,
+    IngestionSettings,
+    ModelSettings,
+)
 
 try:
     from typing import Self
@@ -65,8 +73,11 @@ class ArticleSettings(BaseModel):
     """
 
     api: APISettings
+    cache: CacheSettings = Field(default_factory=CacheSettings)
     files: FileSettings
     git: GitSettings
+    http: HttpSettings = Field(default_factory=HttpSettings)
+    ingestion: IngestionSettings = Field(default_factory=IngestionSettings)
     llm: ModelSettings
     md: ArticleMarkdownSettings
 
@@ -3,7 +3,7 @@
 from typing import Dict
 
 from readmeai.readmegen_article.config.settings import ArticleSettings
-from readmeai.ingestion.models import RepositoryContext
+from readmeai.ingestion.models import FileContext, RepositoryContext
 from readmeai.logger import get_logger
 
 _logger = get_logger(__name__)
@@ -77,7 +77,7 @@ def set_additional_contexts_article(
 
 
 def set_summary_context_article(
-    config: ArticleSettings, repo_files: list[tuple[str, str]]
+    config: ArticleSettings, repo_files: list[FileContext]
 ) -> list[dict]:
     """Generates the summary prompts to be used by the LLM API."""
     return [
@@ -6,6 +6,7 @@ from tempfile import NamedTemporaryFile
 from readmeai.readmegen_article.config.settings import ArticleConfigLoader
 from readmeai.ingestion.models import RepositoryContext
 from readmeai.logger import get_logger
+from readmeai.utils.http_client import get_http_client
 
 _logger = get_logger(__name__)
 
@@ -74,16 +75,16 @@ class ArticleFinder:
         to a temporary file and returns the path.
         """
         try:
-            response = requests.get(url, stream=True, timeout=10)
-            content_type = response.headers.get('Content-Type', '')
+            with get_http_client().get(url, stream=True, timeout=10) as response:
+                content_type = response.headers.get('Content-Type', '')
 
-            if response.status_code == 200 and 'application/pdf' in content_type.lower():
-                temp_pdf = NamedTemporaryFile(delete=False, suffix=".pdf", prefix="downloaded_", dir=os.getcwd())
-                with open(temp_pdf.name, 'wb') as pdf_file:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        pdf_file.write(chunk)
+                if response.status_code == 200 and 'application/pdf' in content_type.lower():
+                    temp_pdf = NamedTemporaryFile(delete=False, suffix=".pdf", prefix="downloaded_", dir=os.getcwd())
+                    with open(temp_pdf.name, 'wb') as pdf_file:
+                        for chunk in response.iter_content(chunk_size=8192):
+                            pdf_file.write(chunk)
 
-                return temp_pdf.name
+                    return temp_pdf.name
 
         except requests.exceptions.RequestException as e:
             _logger.error(f"Error accessing {url}", exc_info=True)
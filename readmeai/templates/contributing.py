@@ -1,5 +1,3 @@
-import requests
-
 from pathlib import Path
 from string import Template
 
@@ -8,6 +6,7 @@ from readmeai.ingestion.models import RepositoryContext
 from readmeai.readers.git.providers import GitHost
 from readmeai.readers.git.metadata import fetch_git_repository_metadata
 from readmeai.utils.helpers import is_available
+from readmeai.utils.url_probe import get_url_prober
 
 if is_available("tomllib"):  # pragma: no cover
     import tomllib
@@ -49,25 +48,33 @@ class ContributingBuilder:
         with open(config_path, "rb") as f:
             return tomllib.load(f)
 
-    def _check_url(self, url):
-        response = requests.get(url)
-        return response.status_code == 200
-
     def build(self):
+        discussions_url = (
+            f"https://{self.host_domain}/{self.full_name}/discussions"
+        )
+        contributing_url = self._find_contributing_url()
+        # Both links are probed at once, within the prober's deadline.
+        reachable = get_url_prober().probe(
+            url for url in (discussions_url, contributing_url) if url
+        )
+
         main_template = Template(self.contributing_config["templates"]["main"])
         return main_template.safe_substitute(
-            discussion_section=self._format_discussions(),
+            discussion_section=self._format_discussions(
+                discussions_url, reachable
+            ),
             issues_section=self._format_issues(),
-            contributing_section=self._format_contributing(),
+            contributing_section=self._format_contributing(
+                contributing_url, reachable
+            ),
         )
 
-    def _format_discussions(self) -> str:
+    def _format_discussions(self, url: str, reachable: dict[str, bool]) -> str:
         template = Template(
             self.contributing_config["templates"]["discussion_section"]
         )
-        url = f"https://{self.host_domain}/{self.full_name}/discussions"
 
-        if self._check_url(url=url):
+        if reachable.get(url):
             return template.safe_substitute(
                 discussions_url=url,
             )
@@ -82,10 +89,7 @@ class ContributingBuilder:
             repo_name=self.git.name,
         )
 
-    def _format_contributing(self):
-        template = Template(
-            self.contributing_config["templates"]["contributing_section"]
-        )
+    def _find_contributing_url(self) -> str | None:
         base_url = f"https://{self.host_domain}/{self.full_name}/blob/"
         url = None
         for key, file in self.contributing_config["files"].items():
@@ -96,13 +100,23 @@ class ContributingBuilder:
                     url = (
                         base_url
                         + f"{self.metadata.default_branch}/"
-                        + f"{str(Path(file_path).as_posix())}"
+                        + self.repo_context.repository_path(
+                            Path(file_path).as_posix()
+                        )
                     )
                     break
             if url:
                 break
+        return url
+
+    def _format_contributing(
+        self, url: str | None, reachable: dict[str, bool]
+    ) -> str:
+        template = Template(
+            self.contributing_config["templates"]["contributing_section"]
+        )
 
-        if url and self._check_url(url):
+        if url and reachable.get(url):
             return template.safe_substitute(
                 contributing_url=url,
                 repo_name=self.git.name,
@@ -0,0 +1,81 @@
+"""Size-bounded on-disk JSON cache with least-recently-used eviction."""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from readmeai.logger import get_logger
+
+_logger = get_logger(__name__)
+
+
+class DiskCache:
+    """
+    JSON entries stored one per file, evicted by last access time.
+
+    Entries are written atomically, so several threads or processes can
+    share a cache directory. Reading an entry bumps its modification time,
+    which is what the LRU eviction in `prune` orders by.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for the key, or None on a miss."""
+        path = self._entry_path(key)
+        try:
+            with open(path, encoding="utf-8") as file:
+                value = json.load(file)
+            os.utime(path)
+            return value
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            _logger.warning(f"Discarding unreadable cache entry {path}: {exc}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value under the key."""
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(value, file)
+            os.replace(temp_path, path)
+        except OSError as exc:
+            _logger.warning(f"Error writing cache entry {path}: {exc}")
+
+    def prune(self) -> int:
+        """Evict least recently used entries above max_bytes.
+
+        Returns the number of bytes removed.
+        """
+        entries = []
+        total = 0
+        for path in self.directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total - removed <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            removed += size
+        return removed
+
+    def _entry_path(self, key: str) -> Path:
+        """Map a key to its file, fanned out over 256 subdirectories."""
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return self.directory / digest[:2] / f"{digest}.json"
@@ -0,0 +1,158 @@
+"""Shared HTTP client with pooled connections, retries and host limits."""
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from tenacity import (
+    RetryCallState,
+    Retrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from readmeai.logger import get_logger
+
+_logger = get_logger(__name__)
+
+# Statuses worth retrying: rate limiting and transient server errors.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Methods safe to send again when a response may have been lost.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class _RetryableStatus(Exception):
+    """Raised inside a retried attempt to retry on a response status."""
+
+    def __init__(self, response: requests.Response) -> None:
+        super().__init__(f"HTTP {response.status_code} from {response.url}")
+        self.response = response
+
+
+class HttpClient:
+    """
+    One requests session for every outbound HTTP call of a run.
+
+    Connections are kept alive and pooled per host, so TLS handshakes and
+    DNS lookups are paid once per host. Every request has connect and
+    read timeouts and waits for one of at most `max_per_host` slots of
+    its host. Idempotent requests are retried with exponential backoff on
+    connection errors, timeouts and retryable statuses. Others, e.g.
+    POST, are only retried on connection errors, as the server may have
+    acted on them otherwise. Once retries are exhausted, the last
+    response is returned, or the last error raised.
+    """
+
+    def __init__(
+        self,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        retries: int = 3,
+        max_per_host: int = 8,
+    ) -> None:
+        self.timeout = (connect_timeout, read_timeout)
+        self.retries = retries
+        self.max_per_host = max_per_host
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=max_per_host)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request, see `request`."""
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        """Send a HEAD request, see `request`."""
+        return self.request("HEAD", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """Send a POST request, see `request`."""
+        return self.request("POST", url, **kwargs)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        retries: int | None = None,
+        **kwargs,
+    ) -> requests.Response:
+        """Send a request through the shared session.
+
+        Keyword arguments are those of `requests.Session.request`, with
+        the client's timeouts as the default `timeout`. `retries` caps the
+        number of attempts for this request.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        retried = (
+            (requests.ConnectionError, requests.Timeout, _RetryableStatus)
+            if method.upper() in IDEMPOTENT_METHODS
+            else requests.ConnectionError
+        )
+        retrying = Retrying(
+            stop=stop_after_attempt(
+                self.retries if retries is None else retries
+            ),
+            wait=wait_exponential(multiplier=0.5, max=8),
+            retry=retry_if_exception_type(retried),
+            before_sleep=_discard_retried_response,
+            reraise=True,
+        )
+        try:
+            return retrying(self._send, method, url, **kwargs)
+        except _RetryableStatus as exc:
+            return exc.response
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.session.close()
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send one attempt of a request within its host's slots."""
+        with self._host_slot(url):
+            response = self.session.request(method, url, **kwargs)
+        if response.status_code in RETRY_STATUSES:
+            raise _RetryableStatus(response)
+        return response
+
+    @contextmanager
+    def _host_slot(self, url: str) -> Iterator[None]:
+        """Hold one of the concurrent request slots of the URL's host."""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            slots = self._host_slots.setdefault(
+                host, threading.BoundedSemaphore(self.max_per_host)
+            )
+        with slots:
+            yield
+
+
+def _discard_retried_response(retry_state: RetryCallState) -> None:
+    """Release the connection of a response about to be retried."""
+    exc = retry_state.outcome.exception()
+    method, url = retry_state.args
+    _logger.debug(f"Retrying {method} {url}: {exc}")
+    if isinstance(exc, _RetryableStatus):
+        exc.response.close()
+
+
+# Shared by every module of a run, with default settings until configured.
+_http_client = HttpClient()
+
+
+def configure_http_client(client: HttpClient) -> None:
+    """Replace the client returned by get_http_client."""
+    global _http_client
+    _http_client = client
+
+
+def get_http_client() -> HttpClient:
+    """Return the HTTP client shared by the run."""
+    return _http_client
@@ -0,0 +1,128 @@
+"""Concurrent, cached checks of whether URLs are reachable."""
+
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+
+import requests
+
+from readmeai.logger import get_logger
+from readmeai.utils.disk_cache import DiskCache
+from readmeai.utils.http_client import get_http_client
+
+_logger = get_logger(__name__)
+
+# Servers answering these to HEAD are retried with a ranged GET.
+_HEAD_UNSUPPORTED = frozenset({403, 405, 501})
+
+# Missing pages; like successes, these answers are kept across runs.
+_GONE = frozenset({404, 410})
+
+
+class UrlProber:
+    """
+    Checks URLs with HEAD requests, falling back to a one-byte ranged GET.
+
+    Probes run concurrently on a shared pool and are memoized for the run,
+    including those still in flight. With a cache directory, definitive
+    answers, a success or a missing page, are also kept on disk for `ttl`
+    seconds. `probe` returns once every probe
+    has finished or `deadline` seconds have passed, whichever is first.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        ttl: float = 86400.0,
+        max_bytes: int = 4 * 1024 * 1024,
+        deadline: float = 10.0,
+        max_workers: int = 8,
+    ) -> None:
+        self.disk_cache = (
+            DiskCache(Path(directory) / "url_probes", max_bytes)
+            if directory is not None
+            else None
+        )
+        self.ttl = ttl
+        self.deadline = deadline
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="url-probe"
+        )
+        self._probes: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def probe(self, urls: Iterable[str]) -> dict[str, bool]:
+        """Check which URLs answer with a success status.
+
+        URLs whose probe fails or misses the deadline count as unreachable.
+        """
+        with self._lock:
+            futures = {}
+            for url in urls:
+                if url not in self._probes:
+                    self._probes[url] = self._executor.submit(self._check, url)
+                futures[url] = self._probes[url]
+
+        done, pending = wait(futures.values(), timeout=self.deadline)
+        if pending:
+            _logger.warning(
+                f"{len(pending)} URL probes missed the "
+                f"{self.deadline:.0f}s deadline"
+            )
+        return {
+            url: future in done and future.result()
+            for url, future in futures.items()
+        }
+
+    def _check(self, url: str) -> bool:
+        """Probe a URL, going through the disk cache if there is one."""
+        cached = (
+            self.disk_cache.get(url) if self.disk_cache is not None else None
+        )
+        if cached and time.time() - cached["checked_at"] < self.ttl:
+            return cached["reachable"]
+
+        client = get_http_client()
+        timeout = (client.timeout[0], self.deadline)
+        try:
+            response = client.head(url, retries=1, timeout=timeout)
+            if response.status_code in _HEAD_UNSUPPORTED:
+                with client.get(
+                    url,
+                    retries=1,
+                    timeout=timeout,
+                    headers={"Range": "bytes=0-0"},
+                    stream=True,
+                ) as response:
+                    pass
+        except requests.RequestException as exc:
+            _logger.debug(f"Probing {url} failed: {exc}")
+            return False
+
+        reachable = 200 <= response.status_code < 300
+        # Transient answers, e.g. rate limits, are only memoized for the run.
+        if self.disk_cache is not None and (
+            reachable or response.status_code in _GONE
+        ):
+            self.disk_cache.set(
+                url, {"reachable": reachable, "checked_at": time.time()}
+            )
+            self.disk_cache.prune()
+        return reachable
+
+
+# Shared by every caller of a run, without a disk cache until configured.
+_url_prober = UrlProber()
+
+
+def configure_url_prober(prober: UrlProber) -> None:
+    """Replace the prober returned by get_url_prober."""
+    global _url_prober
+    _url_prober = prober
+
+
+def get_url_prober() -> UrlProber:
+    """Return the URL prober shared by the run."""
+    return _url_prober
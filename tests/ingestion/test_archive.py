@@ -0,0 +1,69 @@
+"""Tests for streaming repository snapshots from tar archives."""
+
+import io
+import tarfile
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from readmeai.ingestion.archive import ArchiveSource
+
+FILES = {
+    "src/app.py": b"print('hello')\n",
+    "node_modules/lib/index.js": b"module.exports = {};\n",
+    "README.md": b"# Demo\n",
+}
+
+
+def _not_vendored(relative_path: str, size: int) -> bool:
+    return not relative_path.startswith("node_modules/")
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def serve(tmp_path):
+    """Serve tarballs written to a temporary directory over HTTP."""
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), partial(_QuietHandler, directory=str(tmp_path))
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    def write(name: str, prefix: str = "") -> str:
+        with tarfile.open(tmp_path / name, "w:gz") as tar:
+            for path, data in FILES.items():
+                info = tarfile.TarInfo(f"{prefix}{path}")
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+        return f"http://127.0.0.1:{server.server_port}/{name}"
+
+    yield write
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_load_strips_shared_top_level_directory(serve):
+    source = ArchiveSource.load(
+        serve("snapshot.tar.gz", prefix="demo-main/"), _not_vendored
+    )
+
+    assert set(source.entries) == set(FILES)
+    assert source.read("src/app.py") == FILES["src/app.py"]
+    assert source.entries["node_modules/lib/index.js"].data is None
+
+
+def test_load_applies_filter_without_top_level_directory(serve):
+    source = ArchiveSource.load(serve("flat.tar.gz"), _not_vendored)
+
+    assert set(source.entries) == set(FILES)
+    assert source.read("README.md") == FILES["README.md"]
+    assert source.entries["node_modules/lib/index.js"].data is None
+    with pytest.raises(FileNotFoundError):
+        source.read("node_modules/lib/index.js")
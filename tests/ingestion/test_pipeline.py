@@ -0,0 +1,124 @@
+"""Tests for incremental updates of repository contexts."""
+
+import types
+
+import git
+import pytest
+
+from readmeai.config.settings import CacheSettings, IngestionSettings
+from readmeai.ingestion.pipeline import RepositoryProcessor
+from readmeai.utils.file_handler import FileHandler
+from readmeai.utils.file_resource import get_resource_path
+
+SETTINGS_FILES = (
+    "docs_list",
+    "ignore_list",
+    "languages",
+    "parsers",
+    "tool_config",
+    "tooling",
+)
+
+
+@pytest.fixture
+def processor():
+    """A repository processor with the packaged ingestion settings."""
+    file_handler = FileHandler()
+    config = types.SimpleNamespace(
+        config=types.SimpleNamespace(
+            ingestion=IngestionSettings(), cache=CacheSettings()
+        )
+    )
+    for name in SETTINGS_FILES:
+        setattr(
+            config,
+            name,
+            file_handler.read(get_resource_path(file_path=f"{name}.toml")),
+        )
+    return RepositoryProcessor(config)
+
+
+@pytest.fixture
+def commit(tmp_path):
+    """Commit files to a new repository, returning the commit SHA."""
+    repo = git.Repo.init(tmp_path)
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Test")
+        writer.set_value("user", "email", "test@example.com")
+
+    def write(files: dict[str, str | None]) -> str:
+        for path, content in files.items():
+            if content is None:
+                repo.index.remove([path], working_tree=True)
+                continue
+            (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / path).write_text(content)
+            repo.index.add([path])
+        return repo.index.commit("Update").hexsha
+
+    return write
+
+
+def _snapshot(context) -> dict:
+    return context.model_dump(exclude={"ingestion_stats"})
+
+
+def test_update_reads_the_target_commit(processor, commit, tmp_path):
+    first = commit(
+        {
+            "app/main.py": "print('one')\n",
+            "app/util.py": "x = 1\n",
+            "requirements.txt": "flask\n",
+        }
+    )
+    second = commit(
+        {
+            "app/main.py": "print('two')\n",
+            "app/util.py": None,
+            "requirements.txt": "flask\nrequests\n",
+        }
+    )
+    commit({"app/main.py": "print('three')\n", "app/extra.py": "y = 2\n"})
+    (tmp_path / "app/main.py").write_text("print('uncommitted')\n")
+
+    context = processor.process_repository(tmp_path, first)
+    processor.update_repository(context, tmp_path, current_sha=second)
+
+    expected = processor.process_repository(tmp_path, second)
+    assert _snapshot(context) == _snapshot(expected)
+    assert context.commit_sha == second
+    assert [file.path for file in context.files] == [
+        "requirements.txt",
+        "app/main.py",
+    ]
+    assert context.files[1].content == "print('two')"
+    assert "requests" in context.dependencies
+
+
+def test_update_applies_gitignore_of_unchanged_directories(
+    processor, commit, tmp_path
+):
+    first = commit({"lib/.gitignore": "generated.py\n", "lib/a.py": "a\n"})
+    second = commit({"lib/generated.py": "g\n", "lib/b.py": "b\n"})
+
+    context = processor.process_repository(tmp_path, first)
+    processor.update_repository(context, tmp_path, current_sha=second)
+
+    expected = processor.process_repository(tmp_path, second)
+    assert _snapshot(context) == _snapshot(expected)
+    assert "lib/generated.py" not in [file.path for file in context.files]
+
+
+def test_gitignore_change_rebuilds_the_target_commit(
+    processor, commit, tmp_path
+):
+    first = commit({"lib/a.py": "a\n", "src/b.py": "b\n"})
+    second = commit({".gitignore": "lib/\n"})
+    commit({".gitignore": None, "src/c.py": "c\n"})
+
+    context = processor.process_repository(tmp_path, first)
+    processor.update_repository(context, tmp_path, current_sha=second)
+
+    expected = processor.process_repository(tmp_path, second)
+    assert _snapshot(context) == _snapshot(expected)
+    assert [file.path for file in context.files] == ["src/b.py"]